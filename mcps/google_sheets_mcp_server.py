@@ -6,8 +6,244 @@ Provides access to Google Sheets functionality for LLMs through MCP protocol.
 """
 
 from fastmcp import FastMCP
-from typing import List, Dict, Any
+from fastmcp.tools import ToolResult
+from typing import List, Dict, Any, Tuple
+from typing_extensions import TypedDict
 import asyncio
+import collections
+import hashlib
+import inspect
+import json
+import random
+from dataclasses import dataclass
+from string import Template
+from types import MappingProxyType
+import httpx
+import pydantic_core
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@dataclass(frozen=True, slots=True)
+class Spreadsheet:
+    """
+    A spreadsheet file entry returned by list_spreadsheets
+    """
+    id: str
+    name: str
+    mimeType: str
+    createdTime: str
+    modifiedTime: str
+    owners: Tuple[str, ...]
+    webViewLink: str
+
+
+class BatchCall(TypedDict, total=False):
+    """
+    One tool invocation inside batch_execute; input_from is the index of an
+    earlier call whose result fills in any arguments not given in args
+    """
+    method: str
+    args: Dict[str, Any]
+    input_from: int
+
+# Window for coalescing cell writes into one Sheets API request
+BATCH_WINDOW_SECONDS = 0.05
+BATCH_MAX_PENDING = 100
+
+# Sheets allows 60 write requests per minute per user; keep a small safety margin
+WRITE_REQUESTS_PER_MINUTE = 55
+WRITE_MAX_ATTEMPTS = 5
+WRITE_MAX_BACKOFF_SECONDS = 30.0
+
+# Results with more rows than this are JSON-encoded on a worker thread
+OFFLOAD_ENCODE_THRESHOLD = 1000
+
+# Sample values returned by get_sheet_data
+_SAMPLE_SHEET_DATA = tuple(
+    (f"Header {j}", f"Column {j} Data 1", f"Column {j} Data 2")
+    for j in range(3)
+)
+
+async def _execute_batch_update(spreadsheet_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Issue one spreadsheets.values.batchUpdate call for the given spreadsheet
+    """
+    # This would call the Sheets API values:batchUpdate endpoint in a real implementation
+    return {
+        "spreadsheetId": spreadsheet_id,
+        "totalUpdatedRanges": len(body["data"]),
+        "totalUpdatedCells": sum(len(row) for entry in body["data"] for row in entry["values"])
+    }
+
+
+async def _execute_append(spreadsheet_id: str, range: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Issue one spreadsheets.values.append call for the given sheet
+    """
+    # This would call the Sheets API values:append endpoint in a real implementation
+    return {
+        "spreadsheetId": spreadsheet_id,
+        "tableRange": range,
+        "updatedRows": len(body["values"])
+    }
+
+
+class _WriteLimiter:
+    """
+    Async context manager allowing at most `rate` entries per `period` seconds
+    """
+
+    def __init__(self, rate: int, period: float):
+        self.rate = rate
+        self.period = period
+        self._timestamps = collections.deque()
+        self._lock = None
+
+    async def __aenter__(self) -> "_WriteLimiter":
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                while self._timestamps and now - self._timestamps[0] >= self.period:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.rate:
+                    self._timestamps.append(now)
+                    return self
+                await asyncio.sleep(self.period - (now - self._timestamps[0]))
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+
+_write_limiter = _WriteLimiter(WRITE_REQUESTS_PER_MINUTE, 60.0)
+
+
+async def _with_write_retry(func, *args) -> Dict[str, Any]:
+    """
+    Run a Sheets write under the rate limiter, retrying 429 and 5xx responses
+    with randomized exponential backoff
+    """
+    for attempt in range(WRITE_MAX_ATTEMPTS):
+        async with _write_limiter:
+            try:
+                return await func(*args)
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if (status != 429 and status < 500) or attempt == WRITE_MAX_ATTEMPTS - 1:
+                    raise
+        await asyncio.sleep(random.uniform(0, min(WRITE_MAX_BACKOFF_SECONDS, 2 ** attempt)))
+
+
+class _BatchFlusher:
+    """
+    Buffers cell writes for a short window and flushes them as one request per spreadsheet
+    """
+
+    def __init__(self, window: float = BATCH_WINDOW_SECONDS, max_pending: int = BATCH_MAX_PENDING):
+        self.window = window
+        self.max_pending = max_pending
+        self._queue = None
+        self._task = None
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, kind: str, spreadsheet_id: str, range: str, values: List[List[str]]) -> Dict[str, Any]:
+        """
+        Queue a write and wait for the batch that carries it to complete
+        """
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((kind, spreadsheet_id, {"range": range, "values": values}, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(pending) < self.max_pending:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(pending)
+
+    async def _flush(self, pending: List[tuple]) -> None:
+        updates: Dict[str, List[tuple]] = {}
+        appends: Dict[tuple, List[tuple]] = {}
+        for kind, spreadsheet_id, entry, future in pending:
+            if kind == "append":
+                appends.setdefault((spreadsheet_id, entry["range"]), []).append((entry, future))
+            else:
+                updates.setdefault(spreadsheet_id, []).append((entry, future))
+
+        for spreadsheet_id, items in updates.items():
+            body = {"valueInputOption": "RAW", "data": [entry for entry, _ in items]}
+            await self._resolve(items, _with_write_retry, _execute_batch_update, spreadsheet_id, body)
+
+        for (spreadsheet_id, range), items in appends.items():
+            # Consecutive appends to the same sheet collapse into one call
+            body = {"values": [row for entry, _ in items for row in entry["values"]]}
+            await self._resolve(items, _with_write_retry, _execute_append, spreadsheet_id, range, body)
+
+    @staticmethod
+    async def _resolve(items: List[tuple], func, *args) -> None:
+        try:
+            result = await func(*args)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for _, future in items:
+            if not future.done():
+                future.set_result(result)
+
+
+_batch_flusher = _BatchFlusher()
+
+
+def _serialize_tool_result(data: Any) -> str:
+    """
+    Serialize tool results with orjson, or pydantic_core when orjson is not installed
+    """
+    if orjson is None:
+        return pydantic_core.to_json(data, fallback=str).decode()
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _encode_rows_result(rows: List[Any]) -> ToolResult:
+    """
+    Build the wrapped tool result for a row list, matching its output schema
+    """
+    structured = pydantic_core.to_jsonable_python(rows)
+    return ToolResult(
+        content=_serialize_tool_result(structured),
+        structured_content={"result": structured},
+        meta={"fastmcp": {"wrap_result": True}}
+    )
+
+
+async def _offload_large_result(rows: List[Any]) -> Any:
+    """
+    Encode large row lists off the event loop thread so other tool calls keep
+    running; small results are returned as-is and encoded inline
+    """
+    if len(rows) > OFFLOAD_ENCODE_THRESHOLD:
+        return await asyncio.get_running_loop().run_in_executor(None, _encode_rows_result, rows)
+    return rows
 
 
 # Initialize the MCP server
@@ -18,44 +254,48 @@ mcp = FastMCP(
 )
 
 
+async def _list_spreadsheet_rows(query: str = None, max_results: int = 20) -> List[Spreadsheet]:
+    """
+    Fetch the spreadsheet rows behind list_spreadsheets
+    """
+    # This would connect to Google Sheets API in a real implementation
+    return [
+        Spreadsheet(
+            id=f"sheet_{i}",
+            name=f"Sample Spreadsheet {i}",
+            mimeType="application/vnd.google-apps.spreadsheet",
+            createdTime="2023-01-01T10:00:00Z",
+            modifiedTime="2023-01-02T15:30:00Z",
+            owners=("user@example.com",),
+            webViewLink=f"https://docs.google.com/spreadsheets/d/sheet_{i}/edit"
+        )
+        for i in range(max_results)
+    ]
+
+
 # Tools
 @mcp.tool
-def list_spreadsheets(
+async def list_spreadsheets(
     query: str = None, 
     max_results: int = 20
-) -> List[Dict[str, Any]]:
+) -> List[Spreadsheet]:
     """
     List spreadsheets in Google Drive that are Google Sheets
     """
-    # This would connect to Google Sheets API in a real implementation
-    return [
-        {
-            "id": f"sheet_{i}",
-            "name": f"Sample Spreadsheet {i}",
-            "mimeType": "application/vnd.google-apps.spreadsheet",
-            "createdTime": "2023-01-01T10:00:00Z",
-            "modifiedTime": "2023-01-02T15:30:00Z",
-            "owners": ["user@example.com"],
-            "webViewLink": f"https://docs.google.com/spreadsheets/d/sheet_{i}/edit"
-        }
-        for i in range(max_results)
-    ]
+    return await _offload_large_result(await _list_spreadsheet_rows(query, max_results))
 
 
 @mcp.tool
-def get_sheet_data(spreadsheet_id: str, sheet_name: str = "Sheet1", range: str = "A1:Z1000") -> List[List[str]]:
+async def get_sheet_data(spreadsheet_id: str, sheet_name: str = "Sheet1", range: str = "A1:Z1000") -> Tuple[Tuple[str, ...], ...]:
     """
     Get data from a specified range in a Google Sheet
     """
     # This would fetch the actual sheet data from Google Sheets API in a real implementation
-    return [
-        [f"Header {j}", f"Column {j} Data 1", f"Column {j} Data 2"]
-        for j in range(3)
-    ]
+    return _SAMPLE_SHEET_DATA
 
 
 @mcp.tool
-def get_spreadsheet_info(spreadsheet_id: str) -> Dict[str, Any]:
+async def get_spreadsheet_info(spreadsheet_id: str) -> Dict[str, Any]:
     """
     Get information about a specific spreadsheet
     """
@@ -72,7 +312,7 @@ def get_spreadsheet_info(spreadsheet_id: str) -> Dict[str, Any]:
 
 
 @mcp.tool
-def create_spreadsheet(title: str, sheets: List[str] = None) -> Dict[str, str]:
+async def create_spreadsheet(title: str, sheets: List[str] = None) -> Dict[str, str]:
     """
     Create a new Google Sheet
     """
@@ -87,7 +327,7 @@ def create_spreadsheet(title: str, sheets: List[str] = None) -> Dict[str, str]:
 
 
 @mcp.tool
-def update_cells(
+async def update_cells(
     spreadsheet_id: str, 
     sheet_name: str, 
     range: str, 
@@ -96,6 +336,7 @@ def update_cells(
     """
     Update values in specific cells of a Google Sheet
     """
+    await _batch_flusher.submit("update", spreadsheet_id, f"{sheet_name}!{range}", values)
     return {
         "status": "updated",
         "message": f"Updated cells in range {range} of sheet {sheet_name} in spreadsheet {spreadsheet_id}"
@@ -103,7 +344,7 @@ def update_cells(
 
 
 @mcp.tool
-def append_rows(
+async def append_rows(
     spreadsheet_id: str, 
     sheet_name: str, 
     values: List[List[str]]
@@ -111,6 +352,7 @@ def append_rows(
     """
     Append new rows to a Google Sheet
     """
+    await _batch_flusher.submit("append", spreadsheet_id, sheet_name, values)
     return {
         "status": "appended",
         "message": f"Appended {len(values)} rows to sheet {sheet_name} in spreadsheet {spreadsheet_id}"
@@ -118,7 +360,7 @@ def append_rows(
 
 
 @mcp.tool
-def search_in_spreadsheet(spreadsheet_id: str, query: str) -> List[Dict[str, Any]]:
+async def search_in_spreadsheet(spreadsheet_id: str, query: str) -> List[Dict[str, Any]]:
     """
     Search for values in a spreadsheet
     """
@@ -135,7 +377,7 @@ def search_in_spreadsheet(spreadsheet_id: str, query: str) -> List[Dict[str, Any
 
 
 @mcp.tool
-def delete_spreadsheet(spreadsheet_id: str) -> Dict[str, str]:
+async def delete_spreadsheet(spreadsheet_id: str) -> Dict[str, str]:
     """
     Delete a Google Sheet
     """
@@ -146,42 +388,167 @@ def delete_spreadsheet(spreadsheet_id: str) -> Dict[str, str]:
 
 
 @mcp.tool
-def add_sheet(spreadsheet_id: str, sheet_title: str) -> Dict[str, str]:
+async def add_sheet(spreadsheet_id: str, sheet_title: str) -> Dict[str, str]:
     """
     Add a new sheet to an existing spreadsheet
     """
     return {
         "status": "created",
+        "spreadsheet_id": spreadsheet_id,
+        "sheet_name": sheet_title,
         "message": f"Added new sheet '{sheet_title}' to spreadsheet {spreadsheet_id}"
     }
 
 
+# Tools that can be chained through batch_execute, with their parameter names
+_BATCH_METHODS = {
+    tool.__name__: (tool, frozenset(inspect.signature(tool).parameters))
+    for tool in (
+        getattr(t, "fn", t) for t in (
+            get_sheet_data, get_spreadsheet_info, create_spreadsheet, update_cells,
+            append_rows, search_in_spreadsheet, delete_spreadsheet, add_sheet
+        )
+    )
+}
+# list_spreadsheets may return a pre-encoded result, so batches call its row helper
+_BATCH_METHODS["list_spreadsheets"] = (
+    _list_spreadsheet_rows, frozenset(inspect.signature(_list_spreadsheet_rows).parameters)
+)
+
+
+async def _run_batch_call(call: BatchCall, parent_result: Any) -> Dict[str, Any]:
+    """
+    Run a single batch call, filling missing arguments from its parent's result
+    """
+    method = call.get("method")
+    if method not in _BATCH_METHODS:
+        return {"status": "error", "error": f"INVALID_ARGUMENT: unknown method '{method}'"}
+
+    func, params = _BATCH_METHODS[method]
+    args = dict(call.get("args") or {})
+    if isinstance(parent_result, dict):
+        for key, value in parent_result.items():
+            if key in params and key not in args:
+                args[key] = value
+
+    try:
+        result = await func(**args)
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+    return {"status": "ok", "result": result}
+
+
+@mcp.tool
+async def batch_execute(calls: List[BatchCall]) -> List[Dict[str, Any]]:
+    """
+    Run several spreadsheet tools in one request. Calls whose input_from points
+    at an earlier call run after it with its result as default arguments;
+    independent calls run concurrently.
+    """
+    # Group calls into layers by dependency depth
+    depths = []
+    results: List[Dict[str, Any]] = [None] * len(calls)
+    for index, call in enumerate(calls):
+        parent = call.get("input_from", -1)
+        if parent is None or parent < 0:
+            depths.append(0)
+        elif parent >= index:
+            depths.append(None)
+            results[index] = {
+                "status": "error",
+                "error": f"INVALID_ARGUMENT: input_from {parent} must refer to an earlier call"
+            }
+        elif depths[parent] is None:
+            depths.append(None)
+        else:
+            depths.append(depths[parent] + 1)
+
+    layers: Dict[int, List[int]] = {}
+    for index, depth in enumerate(depths):
+        if depth is not None:
+            layers.setdefault(depth, []).append(index)
+
+    for depth in sorted(layers):
+        runnable = []
+        parent_results = []
+        for index in layers[depth]:
+            parent = calls[index].get("input_from", -1)
+            if not depth:
+                parent_results.append(None)
+            elif results[parent]["status"] != "ok":
+                results[index] = {
+                    "status": "error",
+                    "error": f"INVALID_ARGUMENT: parent call {parent} failed"
+                }
+                continue
+            else:
+                parent_results.append(results[parent]["result"])
+            runnable.append(index)
+
+        layer_results = await asyncio.gather(*(
+            _run_batch_call(calls[index], parent_result)
+            for index, parent_result in zip(runnable, parent_results)
+        ))
+        for index, result in zip(runnable, layer_results):
+            results[index] = result
+
+    # Calls that depend on an invalid call fail as well
+    for index, result in enumerate(results):
+        if result is None:
+            results[index] = {
+                "status": "error",
+                "error": f"INVALID_ARGUMENT: parent call {calls[index].get('input_from')} failed"
+            }
+
+    return [{"index": index, **result} for index, result in enumerate(results)]
+
+
+# Static resource payloads, with ETags so clients can skip re-reading them
+_SHEETS_STATUS = MappingProxyType({
+    "status": "connected",
+    "account": "user@gmail.com",  # This would be the connected account
+    "connected": True
+})
+
+_COMMON_FORMULAS = MappingProxyType({
+    "SUM": "=SUM(A1:A10) - Calculate sum of range A1 to A10",
+    "AVERAGE": "=AVERAGE(B1:B10) - Calculate average of range B1 to B10",
+    "COUNT": "=COUNT(C1:C10) - Count non-empty cells in range C1 to C10",
+    "VLOOKUP": "=VLOOKUP(lookup_value, table_array, column_index, FALSE) - Vertical lookup",
+    "IF": "=IF(condition, value_if_true, value_if_false) - Conditional statement"
+})
+_COMMON_FORMULAS_JSON = json.dumps(_COMMON_FORMULAS, default=dict)
+
+# The status ETag covers every field except server_time
+_RESOURCE_ETAGS = {
+    uri: hashlib.blake2b(json.dumps(payload, sort_keys=True, default=dict).encode(), digest_size=8).hexdigest()
+    for uri, payload in (
+        ("http://google-sheets-mcp-server.local/status", _SHEETS_STATUS),
+        ("http://google-sheets-mcp-server.local/formulas", _COMMON_FORMULAS)
+    )
+}
+
+
 # Resources
 @mcp.resource("http://google-sheets-mcp-server.local/status")
-def get_sheets_status() -> Dict[str, Any]:
+async def get_sheets_status() -> Dict[str, Any]:
     """
     Get the status of the Google Sheets MCP server
     """
     return {
-        "status": "connected",
-        "account": "user@gmail.com",  # This would be the connected account
-        "server_time": asyncio.get_event_loop().time(),
-        "connected": True
+        "status": _SHEETS_STATUS["status"],
+        "account": _SHEETS_STATUS["account"],
+        "server_time": asyncio.get_running_loop().time(),
+        "connected": _SHEETS_STATUS["connected"]
     }
 
 
-@mcp.resource("http://google-sheets-mcp-server.local/formulas")
-def get_common_formulas() -> Dict[str, str]:
+@mcp.resource("http://google-sheets-mcp-server.local/formulas", mime_type="application/json")
+def get_common_formulas() -> str:
     """
     Get a list of common Google Sheets formulas
     """
-    return {
-        "SUM": "=SUM(A1:A10) - Calculate sum of range A1 to A10",
-        "AVERAGE": "=AVERAGE(B1:B10) - Calculate average of range B1 to B10",
-        "COUNT": "=COUNT(C1:C10) - Count non-empty cells in range C1 to C10",
-        "VLOOKUP": "=VLOOKUP(lookup_value, table_array, column_index, FALSE) - Vertical lookup",
-        "IF": "=IF(condition, value_if_true, value_if_false) - Conditional statement"
-    }
+    return _COMMON_FORMULAS_JSON
 
 
 @mcp.resource("http://google-sheets-mcp-server.local/usage-stats")
@@ -197,6 +564,49 @@ def get_usage_stats() -> Dict[str, Any]:
     }
 
 
+@mcp.resource("http://google-sheets-mcp-server.local/etags")
+def get_resource_etags() -> Dict[str, str]:
+    """
+    Get ETags of the static resources so clients can skip re-reading unchanged ones
+    """
+    return _RESOURCE_ETAGS
+
+
+# Prompt templates
+_CREATE_ANALYSIS_SHEET_TEMPLATE = Template("""
+Create a Google Sheet with the following specifications:
+- Title: $title
+- Data Columns: $data_columns
+- Analysis Types: $analysis_types
+- Context: $context
+
+Set up appropriate headers, formatting, and formulas for the requested analysis.
+""")
+
+_PERFORM_ANALYSIS_TEMPLATE = Template("""
+Perform the following analysis on spreadsheet $spreadsheet_id, sheet $sheet_name:
+- Request: $analysis_request
+- Context: $context
+
+Use appropriate formulas and functions to extract insights from the data.
+""")
+
+_CREATE_CHART_TEMPLATE = Template("""
+Create a $chart_type chart in spreadsheet $spreadsheet_id using data range $data_range
+- Context: $context
+
+Set up appropriate axis labels, titles, and formatting for the chart.
+""")
+
+_DATA_CLEANUP_TEMPLATE = Template("""
+Clean up data in spreadsheet $spreadsheet_id, sheet $sheet_name according to:
+- Requirements: $cleanup_requirements
+- Context: $context
+
+Address issues like duplicates, formatting, null values, etc.
+""")
+
+
 # Prompts
 @mcp.prompt("/sheets-create-analysis-sheet")
 def create_analysis_sheet_prompt(
@@ -208,15 +618,12 @@ def create_analysis_sheet_prompt(
     """
     Generate a prompt for creating a Google Sheet for data analysis
     """
-    return f"""
-Create a Google Sheet with the following specifications:
-- Title: {title}
-- Data Columns: {data_columns}
-- Analysis Types: {analysis_types}
-- Context: {context}
-
-Set up appropriate headers, formatting, and formulas for the requested analysis.
-"""
+    return _CREATE_ANALYSIS_SHEET_TEMPLATE.substitute(
+        title=title,
+        data_columns=data_columns,
+        analysis_types=analysis_types,
+        context=context
+    )
 
 
 @mcp.prompt("/sheets-perform-analysis")
@@ -229,13 +636,12 @@ def perform_analysis_prompt(
     """
     Generate a prompt for performing data analysis on a Google Sheet
     """
-    return f"""
-Perform the following analysis on spreadsheet {spreadsheet_id}, sheet {sheet_name}:
-- Request: {analysis_request}
-- Context: {context}
-
-Use appropriate formulas and functions to extract insights from the data.
-"""
+    return _PERFORM_ANALYSIS_TEMPLATE.substitute(
+        spreadsheet_id=spreadsheet_id,
+        sheet_name=sheet_name,
+        analysis_request=analysis_request,
+        context=context
+    )
 
 
 @mcp.prompt("/sheets-chart-creation")
@@ -248,12 +654,12 @@ def create_chart_prompt(
     """
     Generate a prompt for creating a chart in Google Sheets
     """
-    return f"""
-Create a {chart_type} chart in spreadsheet {spreadsheet_id} using data range {data_range}
-- Context: {context}
-
-Set up appropriate axis labels, titles, and formatting for the chart.
-"""
+    return _CREATE_CHART_TEMPLATE.substitute(
+        chart_type=chart_type,
+        spreadsheet_id=spreadsheet_id,
+        data_range=data_range,
+        context=context
+    )
 
 
 @mcp.prompt("/sheets-data-cleanup")
@@ -266,15 +672,21 @@ def data_cleanup_prompt(
     """
     Generate a prompt for cleaning up data in a Google Sheet
     """
-    return f"""
-Clean up data in spreadsheet {spreadsheet_id}, sheet {sheet_name} according to:
-- Requirements: {cleanup_requirements}
-- Context: {context}
-
-Address issues like duplicates, formatting, null values, etc.
-"""
+    return _DATA_CLEANUP_TEMPLATE.substitute(
+        spreadsheet_id=spreadsheet_id,
+        sheet_name=sheet_name,
+        cleanup_requirements=cleanup_requirements,
+        context=context
+    )
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Use stdio transport for MCP server (proper MCP protocol communication)
     asyncio.run(mcp.run_stdio_async())
\ No newline at end of file
@@ -6,9 +6,99 @@ Provides access to interview scheduling functionality for LLMs through MCP proto
 """
 
 from fastmcp import FastMCP
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import asyncio
-from datetime import datetime, timedelta
+import functools
+import hashlib
+import itertools
+import json
+import random
+import uuid
+from string import Template
+from types import MappingProxyType
+from dataclasses import dataclass, replace
+from datetime import date
+
+
+@dataclass(frozen=True, slots=True)
+class InterviewSummary:
+    """
+    A scheduled interview row returned by get_interviewer_schedule
+    """
+    interview_id: str
+    candidate: str
+    position: str
+    date: str
+    time: str
+    duration: str
+    status: str
+    interviewers: Tuple[str, ...]
+    type: str
+
+
+@dataclass(frozen=True, slots=True)
+class UpcomingInterview(InterviewSummary):
+    """
+    A scheduled interview row returned by get_upcoming_interviews
+    """
+    location: str
+
+
+@dataclass(frozen=True, slots=True)
+class Interview(UpcomingInterview):
+    """
+    A scheduled interview row returned by the candidate schedule tools
+    """
+    meeting_link: str
+
+
+# Interview IDs: a per-process random prefix plus a monotonic counter
+_INTERVIEW_ID_PREFIX = uuid.uuid4().hex[:8]
+_interview_counter = itertools.count(1)
+
+# Shared generator for simulated availability
+_rng = random.Random()
+
+# Sample rows for get_upcoming_interviews; "date" is stamped per call
+_UPCOMING_INTERVIEW_TEMPLATES = tuple(
+    UpcomingInterview(
+        interview_id=f"int_{1000+i}",
+        candidate=f"Candidate {i+1}",
+        position="Software Engineer",
+        date="",
+        time=f"1{2+i}:00",
+        duration="60 minutes",
+        status="scheduled",
+        interviewers=("Interviewer A", "Interviewer B"),
+        type="technical",
+        location="virtual"
+    )
+    for i in range(3)
+)
+
+
+# Minute offsets for every zero-padded HH:MM time of day
+_MINUTES_BY_TIME = {f"{h:02d}:{m:02d}": h * 60 + m for h in range(24) for m in range(60)}
+
+
+def _time_to_minutes(value: str) -> int:
+    """
+    Convert an HH:MM time to minutes since midnight
+    """
+    minutes = _MINUTES_BY_TIME.get(value)
+    if minutes is None:
+        # Fall back to parsing times that are not zero-padded, e.g. "9:00"
+        hour, minute = map(int, value.split(':'))
+        minutes = hour * 60 + minute
+    return minutes
+
+
+@functools.lru_cache(maxsize=256)
+def _join_names(names: Tuple[str, ...]) -> str:
+    """
+    Join interviewer names for display, memoized per name list
+    """
+    return ", ".join(names)
 
 
 # Initialize the MCP server
@@ -21,7 +111,7 @@ mcp = FastMCP(
 
 # Tools
 @mcp.tool
-def schedule_interview(
+async def schedule_interview(
     candidate_name: str,
     candidate_email: str,
     interviewer_names: List[str],
@@ -39,8 +129,8 @@ def schedule_interview(
     # In a real implementation, this would integrate with a calendar system
     return {
         "status": "scheduled",
-        "message": f"Interview scheduled for {candidate_name} with {', '.join(interviewer_names)}",
-        "interview_id": f"int_{hash(candidate_name + interview_date + interview_time) % 10000}",
+        "message": f"Interview scheduled for {candidate_name} with {_join_names(tuple(interviewer_names))}",
+        "interview_id": f"int_{_INTERVIEW_ID_PREFIX}{next(_interview_counter):08x}",
         "candidate": candidate_name,
         "date": interview_date,
         "time": interview_time,
@@ -48,83 +138,101 @@ def schedule_interview(
     }
 
 
-@mcp.tool
-def get_candidate_schedule(candidate_email: str) -> List[Dict[str, Any]]:
+async def _fetch_candidate_schedule(candidate_email: str) -> List[Interview]:
     """
-    Get scheduled interviews for a candidate
+    Fetch scheduled interviews for one candidate
     """
     # This would retrieve from a database in a real implementation
     # For simulation, returning sample data
     return [
-        {
-            "interview_id": "int_1234",
-            "candidate": "John Doe",
-            "position": "Software Engineer",
-            "date": "2023-06-15",
-            "time": "10:00",
-            "duration": "60 minutes",
-            "status": "scheduled",
-            "interviewers": ["Alice Johnson", "Bob Smith"],
-            "type": "technical",
-            "location": "virtual",
-            "meeting_link": "https://meet.example.com/interview/1234"
-        },
-        {
-            "interview_id": "int_5678",
-            "candidate": "John Doe",
-            "position": "Software Engineer",
-            "date": "2023-06-16",
-            "time": "14:00",
-            "duration": "45 minutes",
-            "status": "scheduled",
-            "interviewers": ["Carol Davis"],
-            "type": "behavioral",
-            "location": "virtual",
-            "meeting_link": "https://meet.example.com/interview/5678"
-        }
+        Interview(
+            interview_id="int_1234",
+            candidate="John Doe",
+            position="Software Engineer",
+            date="2023-06-15",
+            time="10:00",
+            duration="60 minutes",
+            status="scheduled",
+            interviewers=("Alice Johnson", "Bob Smith"),
+            type="technical",
+            location="virtual",
+            meeting_link="https://meet.example.com/interview/1234"
+        ),
+        Interview(
+            interview_id="int_5678",
+            candidate="John Doe",
+            position="Software Engineer",
+            date="2023-06-16",
+            time="14:00",
+            duration="45 minutes",
+            status="scheduled",
+            interviewers=("Carol Davis",),
+            type="behavioral",
+            location="virtual",
+            meeting_link="https://meet.example.com/interview/5678"
+        )
     ]
 
 
 @mcp.tool
-def get_interviewer_schedule(
+async def get_candidate_schedule(candidate_email: str) -> List[Interview]:
+    """
+    Get scheduled interviews for a candidate
+    """
+    return await _fetch_candidate_schedule(candidate_email)
+
+
+@mcp.tool
+async def get_bulk_candidate_schedules(candidate_emails: List[str]) -> Dict[str, List[Interview]]:
+    """
+    Get scheduled interviews for several candidates in one call, keyed by email.
+    Prefer this over calling get_candidate_schedule once per candidate.
+    """
+    emails = list(dict.fromkeys(candidate_emails))
+    schedules = await asyncio.gather(*(_fetch_candidate_schedule(email) for email in emails))
+    return dict(zip(emails, schedules))
+
+
+@mcp.tool
+async def get_interviewer_schedule(
     interviewer_email: str = None,
     interviewer_name: str = None,
     date_range_start: str = None,
     date_range_end: str = None
-) -> List[Dict[str, Any]]:
+) -> List[InterviewSummary]:
     """
     Get scheduled interviews for an interviewer
     """
     # This would retrieve from a database in a real implementation
     # For simulation, returning sample data
     return [
-        {
-            "interview_id": "int_1234",
-            "candidate": "John Doe",
-            "position": "Software Engineer",
-            "date": "2023-06-15",
-            "time": "10:00",
-            "duration": "60 minutes",
-            "status": "scheduled",
-            "interviewers": ["Alice Johnson", "Bob Smith"],
-            "type": "technical"
-        },
-        {
-            "interview_id": "int_9012",
-            "candidate": "Jane Smith",
-            "position": "Product Manager",
-            "date": "2023-06-15",
-            "time": "15:00",
-            "duration": "45 minutes",
-            "status": "scheduled",
-            "interviewers": ["Alice Johnson"],
-            "type": "behavioral"
-        }
+        InterviewSummary(
+            interview_id="int_1234",
+            candidate="John Doe",
+            position="Software Engineer",
+            date="2023-06-15",
+            time="10:00",
+            duration="60 minutes",
+            status="scheduled",
+            interviewers=("Alice Johnson", "Bob Smith"),
+            type="technical"
+        ),
+        InterviewSummary(
+            interview_id="int_9012",
+            candidate="Jane Smith",
+            position="Product Manager",
+            date="2023-06-15",
+            time="15:00",
+            duration="45 minutes",
+            status="scheduled",
+            interviewers=("Alice Johnson",),
+            type="behavioral"
+        )
     ]
 
 
 @mcp.tool
-def cancel_interview(interview_id: str, reason: str = "") -> Dict[str, str]:
+async def cancel_interview(interview_id: str, reason: str = "") -> Dict[str, str]:
     """
     Cancel a scheduled interview
     """
@@ -137,7 +245,7 @@ def cancel_interview(interview_id: str, reason: str = "") -> Dict[str, str]:
 
 
 @mcp.tool
-def update_interview(
+async def update_interview(
     interview_id: str,
     candidate_name: str = None,
     interview_date: str = None,
@@ -157,7 +265,7 @@ def update_interview(
     if interview_time:
         changes.append(f"time: {interview_time}")
     if interviewer_names:
-        changes.append(f"interviewers: {', '.join(interviewer_names)}")
+        changes.append(f"interviewers: {_join_names(tuple(interviewer_names))}")
     
     return {
         "status": "updated",
@@ -166,7 +274,7 @@ def update_interview(
 
 
 @mcp.tool
-def get_available_time_slots(
+async def get_available_time_slots(
     interviewer_names: List[str],
     date: str,
     start_time: str = "09:00",
@@ -178,31 +286,26 @@ def get_available_time_slots(
     """
     # This would check actual calendars in a real implementation
     # For simulation, returning sample available slots
-    import random
-    
     # Generate all possible time slots in the range
-    start_hour, start_min = map(int, start_time.split(':'))
-    end_hour, end_min = map(int, end_time.split(':'))
-    
-    current_time = start_hour * 60 + start_min
-    end_time_minutes = end_hour * 60 + end_min
+    start_minutes = _time_to_minutes(start_time)
+    end_minutes = _time_to_minutes(end_time)
     
+    # Walk the slot grid with range() and stop as soon as enough slots are found,
+    # formatting only the slots that are actually returned
     available_slots = []
-    while current_time < end_time_minutes:
-        time_str = f"{current_time // 60:02d}:{current_time % 60:02d}"
-        
+    for minutes in range(start_minutes, end_minutes, interval_minutes):
         # Simulate 30% chance of slot being unavailable
-        if random.random() > 0.3:
-            available_slots.append(time_str)
-        
-        current_time += interval_minutes
+        if _rng.random() > 0.3:
+            available_slots.append(f"{minutes // 60:02d}:{minutes % 60:02d}")
+            # Return maximum 6 available slots for this example
+            if len(available_slots) == 6:
+                break
     
-    # Return maximum 6 available slots for this example
-    return available_slots[:6]
+    return available_slots
 
 
 @mcp.tool
-def send_interview_reminder(interview_id: str) -> Dict[str, str]:
+async def send_interview_reminder(interview_id: str) -> Dict[str, str]:
     """
     Send a reminder for an upcoming interview
     """
@@ -214,40 +317,30 @@ def send_interview_reminder(interview_id: str) -> Dict[str, str]:
 
 
 @mcp.tool
-def get_upcoming_interviews(
+async def get_upcoming_interviews(
     days_ahead: int = 7,
     candidate_name: str = None
-) -> List[Dict[str, Any]]:
+) -> List[UpcomingInterview]:
     """
     Get interviews scheduled within the specified number of days
     """
     # This would retrieve from a database in a real implementation
-    # For simulation, returning sample data
-    from datetime import datetime, timedelta
-    
-    base_date = datetime.now()
+    # For simulation, returning sample data stamped with dates from today
+    today = date.today().toordinal()
     interviews = []
     
-    for i in range(3):
-        interview_date = base_date + timedelta(days=i+1)
-        interviews.append({
-            "interview_id": f"int_{1000+i}",
-            "candidate": candidate_name or f"Candidate {i+1}",
-            "position": "Software Engineer",
-            "date": interview_date.strftime("%Y-%m-%d"),
-            "time": f"1{2+i}:00",
-            "duration": "60 minutes",
-            "status": "scheduled",
-            "interviewers": ["Interviewer A", "Interviewer B"],
-            "type": "technical",
-            "location": "virtual"
-        })
+    for i, template in enumerate(_UPCOMING_INTERVIEW_TEMPLATES):
+        interviews.append(replace(
+            template,
+            candidate=candidate_name or template.candidate,
+            date=date.fromordinal(today + i + 1).isoformat()
+        ))
     
     return interviews
 
 
 @mcp.tool
-def check_candidate_availability(
+async def check_candidate_availability(
     candidate_email: str,
     proposed_date: str,
     proposed_time: str,
@@ -258,8 +351,7 @@ def check_candidate_availability(
     """
     # This would check actual candidate calendar in a real implementation
     # For simulation, returning a random availability check
-    import random
-    is_available = random.choice([True, False])
+    is_available = bool(_rng.getrandbits(1))
     
     return {
         "available": is_available,
@@ -270,7 +362,7 @@ def check_candidate_availability(
 
 
 @mcp.tool
-def get_interview_feedback(interview_id: str) -> Dict[str, Any]:
+async def get_interview_feedback(interview_id: str) -> Dict[str, Any]:
     """
     Get feedback for a completed interview
     """
@@ -292,19 +384,50 @@ def get_interview_feedback(interview_id: str) -> Dict[str, Any]:
     }
 
 
+# Static resource payloads, with ETags so clients can skip re-reading them
+_INTERVIEW_TYPES = (
+    MappingProxyType({"type": "technical", "description": "Technical skills and coding assessment"}),
+    MappingProxyType({"type": "behavioral", "description": "Behavioral and cultural fit assessment"}),
+    MappingProxyType({"type": "system-design", "description": "System design and architecture discussion"}),
+    MappingProxyType({"type": "culture-fit", "description": "Company culture and values alignment"}),
+    MappingProxyType({"type": "take-home", "description": "Take-home assignment review"})
+)
+_INTERVIEW_TYPES_JSON = json.dumps(_INTERVIEW_TYPES, default=dict)
+
+_INTERVIEW_GUIDELINES = MappingProxyType({
+    "title": "Interview Best Practices",
+    "preparation": "Review candidate's resume and portfolio before interview",
+    "conduct": (
+        "Start on time",
+        "Introduce yourself and explain the interview structure",
+        "Ask consistent questions across candidates for fair evaluation",
+        "Take notes during the interview"
+    ),
+    "evaluation": (
+        "Rate candidates on technical skills, communication, and cultural fit",
+        "Provide specific examples in feedback",
+        "Submit feedback within 24 hours of interview"
+    ),
+    "follow_up": "Coordinate with other interviewers to discuss candidate before making a decision"
+})
+_INTERVIEW_GUIDELINES_JSON = json.dumps(_INTERVIEW_GUIDELINES, default=dict)
+
+_RESOURCE_ETAGS = {
+    uri: hashlib.blake2b(json.dumps(payload, sort_keys=True, default=dict).encode(), digest_size=8).hexdigest()
+    for uri, payload in (
+        ("http://interview-scheduler-mcp-server.local/interview-types", _INTERVIEW_TYPES),
+        ("http://interview-scheduler-mcp-server.local/interview-guidelines", _INTERVIEW_GUIDELINES)
+    )
+}
+
+
 # Resources
-@mcp.resource("http://interview-scheduler-mcp-server.local/interview-types")
-def get_interview_types() -> List[Dict[str, str]]:
+@mcp.resource("http://interview-scheduler-mcp-server.local/interview-types", mime_type="application/json")
+def get_interview_types() -> str:
     """
     Get available interview types
     """
-    return [
-        {"type": "technical", "description": "Technical skills and coding assessment"},
-        {"type": "behavioral", "description": "Behavioral and cultural fit assessment"},
-        {"type": "system-design", "description": "System design and architecture discussion"},
-        {"type": "culture-fit", "description": "Company culture and values alignment"},
-        {"type": "take-home", "description": "Take-home assignment review"}
-    ]
+    return _INTERVIEW_TYPES_JSON
 
 
 @mcp.resource("http://interview-scheduler-mcp-server.local/interview-stats")
@@ -323,27 +446,58 @@ def get_interview_stats() -> Dict[str, Any]:
     }
 
 
-@mcp.resource("http://interview-scheduler-mcp-server.local/interview-guidelines")
-def get_interview_guidelines() -> Dict[str, str]:
+@mcp.resource("http://interview-scheduler-mcp-server.local/interview-guidelines", mime_type="application/json")
+def get_interview_guidelines() -> str:
     """
     Get interview guidelines and best practices
     """
-    return {
-        "title": "Interview Best Practices",
-        "preparation": "Review candidate's resume and portfolio before interview",
-        "conduct": [
-            "Start on time",
-            "Introduce yourself and explain the interview structure",
-            "Ask consistent questions across candidates for fair evaluation",
-            "Take notes during the interview"
-        ],
-        "evaluation": [
-            "Rate candidates on technical skills, communication, and cultural fit",
-            "Provide specific examples in feedback",
-            "Submit feedback within 24 hours of interview"
-        ],
-        "follow_up": "Coordinate with other interviewers to discuss candidate before making a decision"
-    }
+    return _INTERVIEW_GUIDELINES_JSON
+
+
+@mcp.resource("http://interview-scheduler-mcp-server.local/etags")
+def get_resource_etags() -> Dict[str, str]:
+    """
+    Get ETags of the static resources so clients can skip re-reading unchanged ones
+    """
+    return _RESOURCE_ETAGS
+
+
+# Prompt templates
+_INTERVIEW_PREPARATION_TEMPLATE = Template("""
+Prepare for interview with candidate: $candidate_profile
+Interview Type: $interview_type
+Position Requirements: $position_requirements
+Context: $context
+
+Suggest relevant questions, technical challenges, and evaluation criteria.
+""")
+
+_CANDIDATE_EVALUATION_TEMPLATE = Template("""
+Evaluate candidate based on:
+Interview Notes: $interview_notes
+Technical Skills: $technical_skills
+Communication Skills: $communication_skills
+Cultural Fit: $cultural_fit
+Context: $context
+
+Provide a comprehensive assessment with recommendations.
+""")
+
+_LOGISTICS_PLANNING_TEMPLATE = Template("""
+Plan logistics for $interview_type interview with participants: $participants
+Technical Requirements: $technical_requirements
+Context: $context
+
+Coordinate technology, materials, and scheduling needs.
+""")
+
+_FEEDBACK_TEMPLATE_TEMPLATE = Template("""
+Create a feedback template for $interview_type interview for $position_level position
+Evaluation Criteria: $evaluation_criteria
+Context: $context
+
+Include specific fields for skills assessment and recommendation.
+""")
 
 
 # Prompts
@@ -357,14 +511,12 @@ def interview_preparation_prompt(
     """
     Generate a prompt for preparing for an interview
     """
-    return f"""
-Prepare for interview with candidate: {candidate_profile}
-Interview Type: {interview_type}
-Position Requirements: {position_requirements}
-Context: {context}
-
-Suggest relevant questions, technical challenges, and evaluation criteria.
-"""
+    return _INTERVIEW_PREPARATION_TEMPLATE.substitute(
+        candidate_profile=candidate_profile,
+        interview_type=interview_type,
+        position_requirements=position_requirements,
+        context=context
+    )
 
 
 @mcp.prompt("/candidate-evaluation")
@@ -378,16 +530,13 @@ def candidate_evaluation_prompt(
     """
     Generate a prompt for evaluating a candidate's interview
     """
-    return f"""
-Evaluate candidate based on:
-Interview Notes: {interview_notes}
-Technical Skills: {technical_skills}
-Communication Skills: {communication_skills}
-Cultural Fit: {cultural_fit}
-Context: {context}
-
-Provide a comprehensive assessment with recommendations.
-"""
+    return _CANDIDATE_EVALUATION_TEMPLATE.substitute(
+        interview_notes=interview_notes,
+        technical_skills=technical_skills,
+        communication_skills=communication_skills,
+        cultural_fit=cultural_fit,
+        context=context
+    )
 
 
 @mcp.prompt("/interview-logistics-planning")
@@ -400,13 +549,12 @@ def logistics_planning_prompt(
     """
     Generate a prompt for planning interview logistics
     """
-    return f"""
-Plan logistics for {interview_type} interview with participants: {participants}
-Technical Requirements: {technical_requirements}
-Context: {context}
-
-Coordinate technology, materials, and scheduling needs.
-"""
+    return _LOGISTICS_PLANNING_TEMPLATE.substitute(
+        interview_type=interview_type,
+        participants=participants,
+        technical_requirements=technical_requirements,
+        context=context
+    )
 
 
 @mcp.prompt("/feedback-template")
@@ -419,15 +567,21 @@ def feedback_template_prompt(
     """
     Generate a prompt for creating interview feedback template
     """
-    return f"""
-Create a feedback template for {interview_type} interview for {position_level} position
-Evaluation Criteria: {evaluation_criteria}
-Context: {context}
-
-Include specific fields for skills assessment and recommendation.
-"""
+    return _FEEDBACK_TEMPLATE_TEMPLATE.substitute(
+        interview_type=interview_type,
+        position_level=position_level,
+        evaluation_criteria=evaluation_criteria,
+        context=context
+    )
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Use stdio transport for MCP server (proper MCP protocol communication)
     asyncio.run(mcp.run_stdio_async())
\ No newline at end of file
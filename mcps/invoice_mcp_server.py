@@ -6,9 +6,127 @@ Provides access to invoice creation and management functionality for LLMs throug
 """
 
 from fastmcp import FastMCP
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import asyncio
-from datetime import datetime, timedelta
+import itertools
+import json
+import secrets
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter, mul
+from types import MappingProxyType
+
+# Vectorize long line-item lists when NumPy is installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Compile the bulk totals kernel when Numba is installed alongside NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+VECTORIZE_ITEMS_THRESHOLD = 256
+
+# Process-local invoice sequence; Python's hash() is salted per process and collides
+_invoice_sequence = itertools.count(1)
+
+
+@lru_cache(maxsize=1)
+def _invoice_id_prefix(year: int, month: int) -> str:
+    """
+    Get the invoice ID prefix for a month, formatted once until the month rolls over
+    """
+    return f"INV-{year:04d}{month:02d}-"
+
+
+_quantity = itemgetter('quantity')
+_unit_price = itemgetter('unit_price')
+
+
+def _items_subtotal(items: List[Dict[str, Any]]) -> float:
+    """
+    Sum quantity * unit_price over invoice line items
+    """
+    if np is not None and len(items) >= VECTORIZE_ITEMS_THRESHOLD:
+        quantities = np.fromiter(map(_quantity, items), dtype=np.float64, count=len(items))
+        unit_prices = np.fromiter(map(_unit_price, items), dtype=np.float64, count=len(items))
+        if _totals_kernel is not None:
+            return _totals_kernel(quantities, unit_prices)
+        return float(quantities @ unit_prices)
+    return sum(map(mul, map(_quantity, items), map(_unit_price, items)))
+
+
+def _items_dot(quantities, unit_prices) -> float:
+    """
+    Multiply-add kernel over quantity and unit price arrays
+    """
+    subtotal = 0.0
+    for i in range(quantities.shape[0]):
+        subtotal += quantities[i] * unit_prices[i]
+    return subtotal
+
+
+# cache=True keeps the compiled kernel on disk so restarts skip the JIT
+_totals_kernel = njit(cache=True)(_items_dot) if njit is not None and np is not None else None
+
+
+# In a real implementation, this would query a database
+# For simulation, sample invoice data indexed by status, client and invoice date
+_INVOICES = (
+    {
+        "invoice_id": "INV-202306-0001",
+        "client_name": "ACME Corporation",
+        "total": 5616.0,
+        "status": "paid",
+        "invoice_date": "2023-06-01",
+        "due_date": "2023-07-01",
+        "payment_date": "2023-06-15"
+    },
+    {
+        "invoice_id": "INV-202306-0002",
+        "client_name": "Globex Inc",
+        "total": 3200.0,
+        "status": "sent",
+        "invoice_date": "2023-06-05",
+        "due_date": "2023-07-05",
+        "payment_date": None
+    },
+    {
+        "invoice_id": "INV-202306-0003",
+        "client_name": "Wayne Enterprises",
+        "total": 8950.0,
+        "status": "overdue",
+        "invoice_date": "2023-05-01",
+        "due_date": "2023-06-01",
+        "payment_date": None
+    }
+)
+
+
+def _positions_by_status(invoices: Tuple[Dict[str, Any], ...]) -> Dict[str, List[int]]:
+    """
+    Group invoice positions by status
+    """
+    index = defaultdict(list)
+    for position, invoice in enumerate(invoices):
+        index[invoice["status"]].append(position)
+    return dict(index)
+
+
+_INVOICES_BY_STATUS = _positions_by_status(_INVOICES)
+
+# Per-position lowercase client names and date ordinals for the fused filter pass
+_INVOICE_CLIENTS = tuple(inv["client_name"].lower() for inv in _INVOICES)
+_INVOICE_ORDINALS = tuple(date.fromisoformat(inv["invoice_date"]).toordinal() for inv in _INVOICES)
+# Invoice dates are indexed as proleptic ordinals so range lookups bisect ints
+_INVOICE_DATE_INDEX = sorted((ordinal, i) for i, ordinal in enumerate(_INVOICE_ORDINALS))
+_INVOICE_DATE_ORDINALS = [ordinal for ordinal, _ in _INVOICE_DATE_INDEX]
+_INVOICE_DATE_POSITIONS = [i for _, i in _INVOICE_DATE_INDEX]
 
 
 # Initialize the MCP server
@@ -35,20 +153,21 @@ def create_invoice(
     """
     Create a new invoice
     """
+    now = datetime.now()
     if invoice_date is None:
-        invoice_date = datetime.now().strftime("%Y-%m-%d")
+        invoice_date = now.strftime("%Y-%m-%d")
     if due_date is None:
         # Default to 30 days from invoice date
         due_date_obj = datetime.strptime(invoice_date, "%Y-%m-%d") + timedelta(days=30)
         due_date = due_date_obj.strftime("%Y-%m-%d")
     
     # Calculate totals
-    subtotal = sum(item['quantity'] * item['unit_price'] for item in items)
+    subtotal = _items_subtotal(items)
     tax_amount = subtotal * tax_rate
     total = subtotal + tax_amount
     
     invoice = {
-        "invoice_id": f"INV-{datetime.now().strftime('%Y%m')}-{hash(client_name) % 10000:04d}",
+        "invoice_id": f"{_invoice_id_prefix(now.year, now.month)}{next(_invoice_sequence):04d}",
         "client_name": client_name,
         "client_email": client_email,
         "client_address": client_address,
@@ -62,7 +181,7 @@ def create_invoice(
         "total": round(total, 2),
         "status": "draft",
         "notes": notes,
-        "created_at": datetime.now().isoformat()
+        "created_at": now.isoformat()
     }
     
     return invoice
@@ -108,49 +227,36 @@ def list_invoices(
     """
     List invoices with optional filters
     """
-    # In a real implementation, this would query a database
-    # For simulation, returning sample invoice data
-    invoices = [
-        {
-            "invoice_id": "INV-202306-0001",
-            "client_name": "ACME Corporation",
-            "total": 5616.0,
-            "status": "paid",
-            "invoice_date": "2023-06-01",
-            "due_date": "2023-07-01",
-            "payment_date": "2023-06-15"
-        },
-        {
-            "invoice_id": "INV-202306-0002",
-            "client_name": "Globex Inc",
-            "total": 3200.0,
-            "status": "sent",
-            "invoice_date": "2023-06-05",
-            "due_date": "2023-07-05",
-            "payment_date": None
-        },
-        {
-            "invoice_id": "INV-202306-0003",
-            "client_name": "Wayne Enterprises",
-            "total": 8950.0,
-            "status": "overdue",
-            "invoice_date": "2023-05-01",
-            "due_date": "2023-06-01",
-            "payment_date": None
-        }
-    ]
+    try:
+        from_ordinal = date.fromisoformat(date_from).toordinal() if date_from else None
+        to_ordinal = date.fromisoformat(date_to).toordinal() if date_to else None
+    except ValueError:
+        return [{"error": "Invalid date filter. Use YYYY-MM-DD"}]
+    needle = client_name.lower() if client_name else None
     
-    # Apply filters if specified
+    # Drive the scan from the narrowest index, then apply every predicate in one pass
+    positions = range(len(_INVOICES))
     if status:
-        invoices = [inv for inv in invoices if inv['status'] == status]
-    if client_name:
-        invoices = [inv for inv in invoices if client_name.lower() in inv['client_name'].lower()]
-    if date_from:
-        invoices = [inv for inv in invoices if inv['invoice_date'] >= date_from]
-    if date_to:
-        invoices = [inv for inv in invoices if inv['invoice_date'] <= date_to]
+        positions = _INVOICES_BY_STATUS.get(status, ())
+    if from_ordinal is not None or to_ordinal is not None:
+        lo = bisect_left(_INVOICE_DATE_ORDINALS, from_ordinal) if from_ordinal is not None else 0
+        hi = (bisect_right(_INVOICE_DATE_ORDINALS, to_ordinal)
+              if to_ordinal is not None else len(_INVOICE_DATE_ORDINALS))
+        if hi - lo < len(positions):
+            positions = sorted(_INVOICE_DATE_POSITIONS[lo:hi])
     
-    return invoices
+    # Copies, so callers cannot mutate the shared sample rows
+    return [
+        dict(_INVOICES[i]) for i in positions
+        if (not status or _INVOICES[i]["status"] == status)
+        and (needle is None or needle in _INVOICE_CLIENTS[i])
+        and (from_ordinal is None or _INVOICE_ORDINALS[i] >= from_ordinal)
+        and (to_ordinal is None or _INVOICE_ORDINALS[i] <= to_ordinal)
+    ]
+
+
+_VALID_STATUSES = frozenset({"draft", "sent", "paid", "overdue", "cancelled"})
+_INVALID_STATUS_MESSAGE = f"Invalid status. Valid options: {sorted(_VALID_STATUSES)}"
 
 
 @mcp.tool
@@ -158,12 +264,10 @@ def update_invoice_status(invoice_id: str, status: str) -> Dict[str, str]:
     """
     Update the status of an invoice
     """
-    valid_statuses = ["draft", "sent", "paid", "overdue", "cancelled"]
-    
-    if status not in valid_statuses:
+    if status not in _VALID_STATUSES:
         return {
             "status": "error",
-            "message": f"Invalid status. Valid options: {valid_statuses}"
+            "message": _INVALID_STATUS_MESSAGE
         }
     
     return {
@@ -205,7 +309,7 @@ def calculate_invoice_totals(items: List[Dict[str, Any]], tax_rate: float = 0.0)
     """
     Calculate totals for invoice items
     """
-    subtotal = sum(item['quantity'] * item['unit_price'] for item in items)
+    subtotal = _items_subtotal(items)
     tax_amount = subtotal * tax_rate
     total = subtotal + tax_amount
     
@@ -244,7 +348,7 @@ def add_payment_record(
         "status": "success",
         "message": f"Payment of ${amount} recorded for invoice {invoice_id}",
         "payment_method": payment_method,
-        "transaction_id": transaction_id or f"txn_{hash(invoice_id) % 10000}"
+        "transaction_id": transaction_id or f"txn_{secrets.token_hex(8)}"
     }
 
 
@@ -264,50 +368,61 @@ def get_client_outstanding_balance(client_name: str) -> Dict[str, float]:
     }
 
 
+# Static resource payloads, frozen and encoded to JSON once at import
+_INVOICE_TEMPLATES = (
+    MappingProxyType({"id": "standard", "name": "Standard Template", "description": "Simple and professional"}),
+    MappingProxyType({"id": "minimal", "name": "Minimal Template", "description": "Clean and modern design"}),
+    MappingProxyType({"id": "detailed", "name": "Detailed Template", "description": "Includes more sections and information"}),
+    MappingProxyType({"id": "freelancer", "name": "Freelancer Template", "description": "Designed for individual contractors"})
+)
+_INVOICE_TEMPLATES_JSON = json.dumps(_INVOICE_TEMPLATES, default=dict)
+
+_TAX_RATES = MappingProxyType({
+    "US-Federal": 0.0,
+    "US-CA": 0.0725,
+    "US-NY": 0.08,
+    "US-TX": 0.0625,
+    "US-FL": 0.06,
+    "EU-VAT": 0.20,
+    "UK-VAT": 0.20,
+    "CA-GST": 0.05
+})
+_TAX_RATES_JSON = json.dumps(_TAX_RATES, default=dict)
+
+_PAYMENT_METHODS = (
+    MappingProxyType({"id": "ach", "name": "ACH Transfer", "description": "Automated Clearing House"}),
+    MappingProxyType({"id": "wire", "name": "Wire Transfer", "description": "Electronic funds transfer"}),
+    MappingProxyType({"id": "check", "name": "Check", "description": "Physical check payment"}),
+    MappingProxyType({"id": "credit_card", "name": "Credit Card", "description": "Major credit cards accepted"}),
+    MappingProxyType({"id": "paypal", "name": "PayPal", "description": "PayPal business account"}),
+    MappingProxyType({"id": "stripe", "name": "Stripe", "description": "Online payment processing"})
+)
+_PAYMENT_METHODS_JSON = json.dumps(_PAYMENT_METHODS, default=dict)
+
+
 # Resources
-@mcp.resource("http://invoice-mcp-server.local/invoice-templates")
-def get_invoice_templates() -> List[Dict[str, str]]:
+@mcp.resource("http://invoice-mcp-server.local/invoice-templates", mime_type="application/json")
+def get_invoice_templates() -> str:
     """
     Get available invoice templates
     """
-    return [
-        {"id": "standard", "name": "Standard Template", "description": "Simple and professional"},
-        {"id": "minimal", "name": "Minimal Template", "description": "Clean and modern design"},
-        {"id": "detailed", "name": "Detailed Template", "description": "Includes more sections and information"},
-        {"id": "freelancer", "name": "Freelancer Template", "description": "Designed for individual contractors"}
-    ]
+    return _INVOICE_TEMPLATES_JSON
 
 
-@mcp.resource("http://invoice-mcp-server.local/tax-rates")
-def get_tax_rates() -> Dict[str, float]:
+@mcp.resource("http://invoice-mcp-server.local/tax-rates", mime_type="application/json")
+def get_tax_rates() -> str:
     """
     Get common tax rates by region
     """
-    return {
-        "US-Federal": 0.0,
-        "US-CA": 0.0725,
-        "US-NY": 0.08,
-        "US-TX": 0.0625,
-        "US-FL": 0.06,
-        "EU-VAT": 0.20,
-        "UK-VAT": 0.20,
-        "CA-GST": 0.05
-    }
+    return _TAX_RATES_JSON
 
 
-@mcp.resource("http://invoice-mcp-server.local/payment-methods")
-def get_payment_methods() -> List[Dict[str, str]]:
+@mcp.resource("http://invoice-mcp-server.local/payment-methods", mime_type="application/json")
+def get_payment_methods() -> str:
     """
     Get supported payment methods
     """
-    return [
-        {"id": "ach", "name": "ACH Transfer", "description": "Automated Clearing House"},
-        {"id": "wire", "name": "Wire Transfer", "description": "Electronic funds transfer"},
-        {"id": "check", "name": "Check", "description": "Physical check payment"},
-        {"id": "credit_card", "name": "Credit Card", "description": "Major credit cards accepted"},
-        {"id": "paypal", "name": "PayPal", "description": "PayPal business account"},
-        {"id": "stripe", "name": "Stripe", "description": "Online payment processing"}
-    ]
+    return _PAYMENT_METHODS_JSON
 
 
 # Prompts
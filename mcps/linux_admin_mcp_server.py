@@ -6,12 +6,70 @@ Provides access to Linux system administration functionality for LLMs through MC
 """
 
 from fastmcp import FastMCP
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import asyncio
+import functools
+from dataclasses import dataclass
+import platform
 import subprocess
 import os
 import pwd
 import grp
+import re
+import threading
+import time
+
+# Talk to systemd over D-Bus when pystemd is installed, otherwise shell out to systemctl
+try:
+    from pystemd.dbuslib import DBus
+    from pystemd.systemd1 import Unit
+except ImportError:
+    DBus = None
+    Unit = None
+
+_system_bus = None
+_system_bus_lock = threading.Lock()
+
+# Query network interfaces over netlink when pyroute2 is installed, otherwise parse `ip addr`
+try:
+    from pyroute2 import IPRoute
+except ImportError:
+    IPRoute = None
+
+_netlink = None
+_netlink_lock = threading.Lock()
+
+# NSS enumeration can be slow (LDAP/SSSD); cached snapshots are reused for this long
+NSS_CACHE_TTL_SECONDS = 60
+
+_group_cache = {"expires": 0.0, "groups": []}
+_user_cache = {"expires": 0.0, "users": []}
+
+# Package names selected for install in `dpkg --get-selections` output
+_INSTALLED_PACKAGE_RE = re.compile(rb'^(\S+)\s+install$', re.M)
+
+
+@dataclass(frozen=True, slots=True)
+class UserRow:
+    """
+    A local account row returned by list_users
+    """
+    username: str
+    uid: int
+    gid: int
+    home_dir: str
+    shell: str
+    full_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class GroupRow:
+    """
+    A local group row returned by list_groups
+    """
+    name: str
+    gid: int
+    members: Tuple[str, ...]
 
 
 # Initialize the MCP server
@@ -24,21 +82,11 @@ mcp = FastMCP(
 
 # Tools
 @mcp.tool
-def list_users() -> List[Dict[str, Any]]:
+def list_users() -> List[UserRow]:
     """
     List all users on the Linux system
     """
-    users = []
-    for user in pwd.getpwall():
-        users.append({
-            "username": user.pw_name,
-            "uid": user.pw_uid,
-            "gid": user.pw_gid,
-            "home_dir": user.pw_dir,
-            "shell": user.pw_shell,
-            "full_name": user.pw_gecos.split(',')[0] if user.pw_gecos else user.pw_name
-        })
-    return users
+    return list(_user_snapshot()["users"])
 
 
 @mcp.tool
@@ -55,7 +103,7 @@ def get_user_info(username: str) -> Dict[str, str]:
             "home_dir": user_info.pw_dir,
             "shell": user_info.pw_shell,
             "full_name": user_info.pw_gecos,
-            "groups": [group.gr_name for group in grp.getgrall() if username in group.gr_mem]
+            "groups": _user_group_names(user_info)
         }
     except KeyError:
         return {"error": f"User {username} not found"}
@@ -106,29 +154,91 @@ def delete_user(username: str, remove_home: bool = False) -> Dict[str, str]:
 
 
 @mcp.tool
-def list_groups() -> List[Dict[str, Any]]:
+def list_groups() -> List[GroupRow]:
     """
     List all groups on the Linux system
     """
-    groups = []
-    for group in grp.getgrall():
-        groups.append({
-            "name": group.gr_name,
-            "gid": group.gr_gid,
-            "members": group.gr_mem
-        })
-    return groups
+    return list(_group_snapshot()["groups"])
+
+
+def _group_snapshot() -> Dict[str, Any]:
+    """
+    Get the cached group list, refreshing it after the TTL
+    """
+    now = time.monotonic()
+    if now >= _group_cache["expires"]:
+        _group_cache.update(
+            expires=now + NSS_CACHE_TTL_SECONDS,
+            groups=[GroupRow(name=group.gr_name, gid=group.gr_gid, members=tuple(group.gr_mem))
+                    for group in grp.getgrall()]
+        )
+    return _group_cache
+
+
+def _user_group_names(user_info: pwd.struct_passwd) -> List[str]:
+    """
+    Resolve a user's group names via getgrouplist instead of enumerating every group
+    """
+    names = []
+    for gid in os.getgrouplist(user_info.pw_name, user_info.pw_gid):
+        try:
+            names.append(grp.getgrgid(gid).gr_name)
+        except KeyError:
+            names.append(str(gid))
+    return names
+
+
+def _user_snapshot() -> Dict[str, Any]:
+    """
+    Get the cached user rows, refreshing them after the TTL
+    """
+    now = time.monotonic()
+    if now >= _user_cache["expires"]:
+        users = [
+            UserRow(
+                username=user.pw_name,
+                uid=user.pw_uid,
+                gid=user.pw_gid,
+                home_dir=user.pw_dir,
+                shell=user.pw_shell,
+                full_name=user.pw_gecos.split(',')[0] if user.pw_gecos else user.pw_name
+            )
+            for user in pwd.getpwall()
+        ]
+        _user_cache.update(
+            expires=now + NSS_CACHE_TTL_SECONDS,
+            users=users
+        )
+    return _user_cache
+
+
+async def _run_command(args: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """
+    Run a command without blocking the event loop, capturing stdout and stderr as bytes
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(args, timeout)
+    return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
 
 
 @mcp.tool
-def get_service_status(service_name: str) -> Dict[str, str]:
+async def get_service_status(service_name: str) -> Dict[str, str]:
     """
     Get the status of a systemd service
     """
     try:
-        result = subprocess.run(['systemctl', 'is-active', service_name], 
-                                capture_output=True, text=True, timeout=10)
-        status = result.stdout.strip()
+        if Unit is not None:
+            status = (await asyncio.to_thread(_unit_active_states, [service_name]))[0]
+        else:
+            result = await _run_command(['systemctl', 'is-active', service_name], timeout=10)
+            status = result.stdout.strip().decode()
         return {
             "service": service_name,
             "status": status,
@@ -149,87 +259,109 @@ def get_service_status(service_name: str) -> Dict[str, str]:
 
 
 @mcp.tool
-def start_service(service_name: str) -> Dict[str, str]:
+async def get_services_status(service_names: List[str]) -> List[Dict[str, str]]:
     """
-    Start a systemd service
+    Get the status of several systemd services in one systemctl call
     """
     try:
-        result = subprocess.run(['sudo', 'systemctl', 'start', service_name], 
-                                capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return {
-                "status": "success",
-                "message": f"Service {service_name} started successfully"
-            }
+        if Unit is not None:
+            states = await asyncio.to_thread(_unit_active_states, service_names)
         else:
-            return {
-                "status": "error",
-                "message": result.stderr
+            result = await _run_command(['systemctl', 'show', '--property=ActiveState', '--value', *service_names], timeout=10)
+            if result.returncode != 0:
+                return [{"error": "Failed to get service status", "details": result.stderr.decode(errors="replace")}]
+            # Values for consecutive units are separated by blank lines
+            states = [line for line in result.stdout.decode().splitlines() if line]
+        return [
+            {
+                "service": name,
+                "status": status,
+                "message": f"Service {name} is {status}"
             }
+            for name, status in zip(service_names, states)
+        ]
     except subprocess.TimeoutExpired:
-        return {
-            "status": "error",
-            "message": f"Timeout while starting service {service_name}"
-        }
+        return [{"error": f"Timeout while checking services {', '.join(service_names)}"}]
     except Exception as e:
-        return {
-            "status": "error",
-            "message": str(e)
-        }
+        return [{"error": str(e)}]
 
 
 @mcp.tool
-def stop_service(service_name: str) -> Dict[str, str]:
+async def start_service(service_name: str) -> Dict[str, str]:
+    """
+    Start a systemd service
+    """
+    return await _control_service(service_name, "start", "starting", "started")
+
+
+@mcp.tool
+async def stop_service(service_name: str) -> Dict[str, str]:
     """
     Stop a systemd service
     """
-    try:
-        result = subprocess.run(['sudo', 'systemctl', 'stop', service_name], 
-                                capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return {
-                "status": "success",
-                "message": f"Service {service_name} stopped successfully"
-            }
-        else:
-            return {
-                "status": "error",
-                "message": result.stderr
-            }
-    except subprocess.TimeoutExpired:
-        return {
-            "status": "error",
-            "message": f"Timeout while stopping service {service_name}"
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "message": str(e)
-        }
+    return await _control_service(service_name, "stop", "stopping", "stopped")
 
 
 @mcp.tool
-def restart_service(service_name: str) -> Dict[str, str]:
+async def restart_service(service_name: str) -> Dict[str, str]:
     """
     Restart a systemd service
     """
+    return await _control_service(service_name, "restart", "restarting", "restarted")
+
+
+def _load_unit(service_name: str) -> "Unit":
+    """
+    Load a systemd unit over the shared D-Bus connection; callers hold _system_bus_lock
+    """
+    global _system_bus
+    if _system_bus is None:
+        _system_bus = DBus()
+        _system_bus.open()
+    unit_name = service_name if "." in service_name else f"{service_name}.service"
+    unit = Unit(unit_name.encode(), bus=_system_bus)
+    unit.load()
+    return unit
+
+
+def _unit_active_states(service_names: List[str]) -> List[str]:
+    """
+    Read the ActiveState of each unit; runs on a worker thread
+    """
+    with _system_bus_lock:
+        return [_load_unit(name).Unit.ActiveState.decode() for name in service_names]
+
+
+def _control_unit(service_name: str, action: str) -> None:
+    """
+    Call Start, Stop or Restart on a unit; runs on a worker thread
+    """
+    with _system_bus_lock:
+        getattr(_load_unit(service_name).Unit, action.capitalize())(b"replace")
+
+
+async def _control_service(service_name: str, action: str, action_progress: str, action_done: str) -> Dict[str, str]:
+    """
+    Start, stop or restart a systemd service
+    """
     try:
-        result = subprocess.run(['sudo', 'systemctl', 'restart', service_name], 
-                                capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            return {
-                "status": "success",
-                "message": f"Service {service_name} restarted successfully"
-            }
+        if Unit is not None:
+            await asyncio.to_thread(_control_unit, service_name, action)
         else:
-            return {
-                "status": "error",
-                "message": result.stderr
-            }
+            result = await _run_command(['sudo', 'systemctl', action, service_name], timeout=30)
+            if result.returncode != 0:
+                return {
+                    "status": "error",
+                    "message": result.stderr.decode(errors="replace")
+                }
+        return {
+            "status": "success",
+            "message": f"Service {service_name} {action_done} successfully"
+        }
     except subprocess.TimeoutExpired:
         return {
             "status": "error",
-            "message": f"Timeout while restarting service {service_name}"
+            "message": f"Timeout while {action_progress} service {service_name}"
         }
     except Exception as e:
         return {
@@ -239,23 +371,19 @@ def restart_service(service_name: str) -> Dict[str, str]:
 
 
 @mcp.tool
-def list_packages() -> List[Dict[str, str]]:
+async def list_packages() -> List[Dict[str, str]]:
     """
     List installed packages (assumes apt-based system)
     """
     try:
-        result = subprocess.run(['dpkg', '--get-selections'], 
-                                capture_output=True, text=True, timeout=30)
+        result = await _run_command(['dpkg', '--get-selections'], timeout=30)
         if result.returncode == 0:
-            packages = []
-            for line in result.stdout.splitlines():
-                if line and "\tinstall" in line:
-                    parts = line.split("\t")
-                    package_name = parts[0]
-                    packages.append({"name": package_name, "status": "installed"})
-            return packages
+            return [
+                {"name": name.decode(), "status": "installed"}
+                for name in _INSTALLED_PACKAGE_RE.findall(result.stdout)
+            ]
         else:
-            return [{"error": "Failed to list packages", "details": result.stderr}]
+            return [{"error": "Failed to list packages", "details": result.stderr.decode(errors="replace")}]
     except subprocess.TimeoutExpired:
         return [{"error": "Timeout while listing packages"}]
     except Exception as e:
@@ -268,37 +396,61 @@ def check_disk_usage(path: str = "/") -> Dict[str, str]:
     Check disk usage for a given path
     """
     try:
-        result = subprocess.run(['df', '-h', path], 
-                                capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:
-                header = lines[0].split()
-                values = lines[1].split()
-                usage_info = dict(zip(header, values))
-                return {
-                    "path": path,
-                    "size": usage_info.get('1K-blocks', 'N/A'),
-                    "used": usage_info.get('Used', 'N/A'),
-                    "available": usage_info.get('Available', 'N/A'),
-                    "use_percent": usage_info.get('Use%', 'N/A'),
-                    "mounted_on": usage_info.get('Mounted on', 'N/A')
-                }
-        return {"error": f"Failed to check disk usage for {path}"}
+        stat = os.statvfs(path)
+        size = stat.f_frsize * stat.f_blocks
+        used = stat.f_frsize * (stat.f_blocks - stat.f_bfree)
+        available = stat.f_frsize * stat.f_bavail
+        
+        # Same as df: usage relative to the space available to unprivileged users
+        usable = used + available
+        use_percent = f"{round(100 * used / usable, 1)}%" if usable else "0%"
+        
+        mount_point = os.path.realpath(path)
+        while not os.path.ismount(mount_point):
+            mount_point = os.path.dirname(mount_point)
+        
+        return {
+            "path": path,
+            "size": format_bytes(size),
+            "used": format_bytes(used),
+            "available": format_bytes(available),
+            "use_percent": use_percent,
+            "mounted_on": mount_point
+        }
     except Exception as e:
         return {"error": str(e)}
 
 
+def format_bytes(bytes_value: int) -> str:
+    """
+    Format bytes value to human readable format
+    """
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if bytes_value < 1024.0:
+            return f"{bytes_value:.2f} {unit}"
+        bytes_value /= 1024.0
+    return f"{bytes_value:.2f} PB"
+
+
 # Resources
 @mcp.resource("http://linux-admin-mcp-server.local/system-info")
 def get_system_info() -> Dict[str, Any]:
     """
     Get comprehensive system information
     """
-    import platform
-    
     return {
         "hostname": os.uname().nodename,
+        **_platform_info()
+    }
+
+
+@functools.cache
+def _platform_info() -> Dict[str, str]:
+    """
+    Get platform details, which are fixed for the process lifetime
+    """
+    # processor() and architecture() may shell out to uname/file, so run them once
+    return {
         "system": platform.system(),
         "release": platform.release(),
         "version": platform.version(),
@@ -310,15 +462,15 @@ def get_system_info() -> Dict[str, Any]:
 
 
 @mcp.resource("http://linux-admin-mcp-server.local/user-sessions")
-def get_user_sessions() -> List[Dict[str, str]]:
+async def get_user_sessions() -> List[Dict[str, str]]:
     """
     Get information about active user sessions
     """
     try:
-        result = subprocess.run(['who'], capture_output=True, text=True, timeout=10)
+        result = await _run_command(['who'], timeout=10)
         if result.returncode == 0:
             sessions = []
-            for line in result.stdout.strip().split('\n'):
+            for line in result.stdout.decode(errors="replace").strip().split('\n'):
                 if line:
                     parts = line.split()
                     if len(parts) >= 3:
@@ -330,39 +482,65 @@ def get_user_sessions() -> List[Dict[str, str]]:
                         })
             return sessions
         else:
-            return [{"error": "Failed to get user sessions", "details": result.stderr}]
+            return [{"error": "Failed to get user sessions", "details": result.stderr.decode(errors="replace")}]
     except Exception as e:
         return [{"error": str(e)}]
 
 
 @mcp.resource("http://linux-admin-mcp-server.local/network-interfaces")
-def get_network_interfaces() -> List[Dict[str, str]]:
+async def get_network_interfaces() -> List[Dict[str, str]]:
     """
     Get information about network interfaces
     """
     try:
-        result = subprocess.run(['ip', 'addr', 'show'], 
-                                capture_output=True, text=True, timeout=10)
+        if IPRoute is not None:
+            return await asyncio.to_thread(_netlink_interfaces)
+        
+        result = await _run_command(['ip', 'addr', 'show'], timeout=10)
         if result.returncode == 0:
             # Simplified parsing of network interfaces
             interfaces = []
             current_interface = None
             
-            for line in result.stdout.split('\n'):
+            for line in result.stdout.decode(errors="replace").split('\n'):
                 if line.strip() and line[0].isdigit():
                     # New interface
                     parts = line.split(':')
                     if len(parts) >= 2:
-                        current_interface = parts[1].strip()
-                        interfaces.append({"name": current_interface, "info": []})
+                        current_interface = {"name": parts[1].strip(), "info": []}
+                        interfaces.append(current_interface)
+                elif current_interface is not None and line.lstrip().startswith(('inet ', 'inet6 ')):
+                    current_interface["info"].append(line.split()[1])
                 
-            return interfaces or [{"name": "lo", "info": ["127.0.0.1/8"}]
+            return interfaces or [{"name": "lo", "info": ["127.0.0.1/8"]}]
         else:
-            return [{"name": "error", "info": [result.stderr]}]
+            return [{"name": "error", "info": [result.stderr.decode(errors="replace")]}]
     except Exception as e:
         return [{"name": "error", "info": [str(e)]}]
 
 
+def _netlink_interfaces() -> List[Dict[str, Any]]:
+    """
+    List interfaces and their addresses with one netlink round trip each; runs
+    on a worker thread
+    """
+    global _netlink
+    with _netlink_lock:
+        if _netlink is None:
+            _netlink = IPRoute()
+        links = _netlink.get_links()
+        addrs = _netlink.get_addr()
+    
+    interfaces = {}
+    for link in links:
+        interfaces[link["index"]] = {"name": link.get_attr("IFLA_IFNAME"), "info": []}
+    for addr in addrs:
+        interface = interfaces.get(addr["index"])
+        if interface is not None:
+            interface["info"].append(f"{addr.get_attr('IFA_ADDRESS')}/{addr['prefixlen']}")
+    return list(interfaces.values())
+
+
 # Prompts
 @mcp.prompt("/linux-user-management")
 def user_management_prompt(action: str, username: str, context: str = "") -> str:
@@ -6,11 +6,110 @@ Provides access to log viewing and analysis functionality for LLMs through MCP p
 """
 
 from fastmcp import FastMCP
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import asyncio
+import fnmatch
+import functools
+import itertools
+import mmap
 import os
 import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
+
+# Wake follow_log_file on file modifications when inotify_simple is installed
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+    inotify_flags = None
+
+# Block size for reading log tails backwards from the end of the file
+TAIL_BLOCK_SIZE = 8192
+
+# Chunk size for counting newlines in get_log_stats
+LINE_COUNT_BLOCK_SIZE = 1 << 20
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# follow_log_file waits this long for new lines; without inotify it polls the size
+FOLLOW_TIMEOUT_SECONDS = 5.0
+FOLLOW_POLL_INTERVAL_SECONDS = 0.5
+
+# Filesystem-walking resources are polled by clients; snapshots are reused for this long
+RESOURCE_CACHE_TTL_SECONDS = 30
+
+# Cap on entries returned by the line-matching tools, so a term that matches
+# every line of a huge log cannot build an unbounded response
+DEFAULT_MAX_RESULTS = 10000
+
+# Worker threads used to sample files for the log-statistics resource, and how
+# much of each file's head they read (at most LOG_SAMPLE_MAX_BYTES)
+LOG_SCAN_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+LOG_SAMPLE_LINES = 101
+LOG_SAMPLE_BLOCK_SIZE = 16384
+LOG_SAMPLE_MAX_BYTES = LOG_SAMPLE_LINES * LOG_SAMPLE_BLOCK_SIZE
+
+# Common timestamp formats, factored on their shared two-digit prefix so most
+# positions are rejected after one character:
+#   YYYY-MM-DD HH:MM:SS, YYYY-MM-DDTHH:MM:SS (ISO), YYYY/MM/DD HH:MM:SS,
+#   MM/DD/YYYY HH:MM:SS, MM-DD-YYYY HH:MM:SS
+_TIMESTAMP_RE = re.compile(
+    r'\d{2}(?:\d{2}(?:-\d{2}-\d{2}[T ]|/\d{2}/\d{2} )|/\d{2}/\d{4} |-\d{2}-\d{4} )\d{2}:\d{2}:\d{2}'
+)
+
+# First timestamp on each line of a mapped file
+_LINE_TIMESTAMP_BYTES_RE = re.compile(rb'^[^\n]*?(' + _TIMESTAMP_RE.pattern.encode() + rb')', re.MULTILINE)
+
+# Common formats for parse_timestamp
+_TIMESTAMP_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d %H:%M:%S',
+    '%m/%d/%Y %H:%M:%S',
+    '%m-%d-%Y %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+)
+
+# Error keywords, matched straight over a memory-mapped log file
+_ERROR_BYTES_RE = re.compile(rb'error|exception|fail|critical|fatal|warn', re.IGNORECASE)
+
+# Level keywords are plain literals, so a substring test on the lowercased line
+# decides a match without running the regex engine
+_LEVEL_KEYWORDS = {
+    'ERROR': ('error', 'exception', 'critical', 'fatal'),
+    'WARN': ('warn',),
+    'INFO': ('info',),
+    'DEBUG': ('debug',)
+}
+
+
+def _in_thread(func):
+    """
+    Run a blocking file-scanning handler in a worker thread so the event loop stays responsive
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+
+def _ttl_cached(func):
+    """
+    Reuse a resource snapshot for RESOURCE_CACHE_TTL_SECONDS before rebuilding it
+    """
+    cache = {"expires": 0.0, "value": None}
+    
+    @functools.wraps(func)
+    def wrapper():
+        now = time.monotonic()
+        if now >= cache["expires"]:
+            cache["value"] = func()
+            cache["expires"] = now + RESOURCE_CACHE_TTL_SECONDS
+        return cache["value"]
+    return wrapper
 
 
 # Initialize the MCP server
@@ -23,6 +122,7 @@ mcp = FastMCP(
 
 # Tools
 @mcp.tool
+@_in_thread
 def read_log_file(
     file_path: str, 
     lines: int = 50,
@@ -35,24 +135,24 @@ def read_log_file(
         return [f"Error: Log file does not exist: {file_path}"]
     
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            # Read all lines
-            all_lines = f.readlines()
-            
         # Return the last N lines
         if reverse:
-            return [line.rstrip('\n') for line in all_lines[-lines:]]
+            with open(file_path, 'rb') as f:
+                return _tail_lines(f, lines)
         else:
-            return [line.rstrip('\n') for line in all_lines[:lines]]
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                return [line.rstrip('\n') for line in itertools.islice(f, max(lines, 0))]
     except Exception as e:
         return [f"Error reading log file: {str(e)}"]
 
 
 @mcp.tool
+@_in_thread
 def search_logs(
     file_path: str,
     search_term: str,
-    case_sensitive: bool = False
+    case_sensitive: bool = False,
+    max_results: int = DEFAULT_MAX_RESULTS
 ) -> List[Dict[str, Any]]:
     """
     Search for a term in a log file and return matching lines with context
@@ -61,26 +161,18 @@ def search_logs(
         return [{"error": f"Log file does not exist: {file_path}"}]
     
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+        search_re = re.compile(search_term, 0 if case_sensitive else re.IGNORECASE)
         
-        matches = []
-        flags = 0 if case_sensitive else re.IGNORECASE
-        
-        for i, line in enumerate(lines):
-            if re.search(search_term, line, flags):
-                matches.append({
-                    "line_number": i + 1,
-                    "content": line.rstrip('\n'),
-                    "timestamp": extract_timestamp(line) or "N/A"
-                })
-        
-        return matches
+        # The search term is a str regex with per-line semantics, so stream lines
+        # instead of mapping the file and matching bytes
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return _first_results(_search_entries(f, search_re), max_results)
     except Exception as e:
         return [{"error": f"Error searching log file: {str(e)}"}]
 
 
 @mcp.tool
+@_in_thread
 def get_log_stats(file_path: str) -> Dict[str, Any]:
     """
     Get statistics about a log file
@@ -90,8 +182,7 @@ def get_log_stats(file_path: str) -> Dict[str, Any]:
     
     try:
         stat = os.stat(file_path)
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            line_count = sum(1 for line in f)
+        line_count = _count_lines(file_path)
         
         return {
             "file_path": file_path,
@@ -107,6 +198,7 @@ def get_log_stats(file_path: str) -> Dict[str, Any]:
 
 
 @mcp.tool
+@_in_thread
 def get_recent_logs(
     directory: str, 
     pattern: str = "*.log",
@@ -120,78 +212,74 @@ def get_recent_logs(
     
     try:
         recent_files = []
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff_timestamp = (datetime.now() - timedelta(hours=hours)).timestamp()
+        pattern_re = re.compile(fnmatch.translate(pattern))
         
-        for filename in os.listdir(directory):
-            if filename.endswith('.log'):  # Basic pattern matching
-                filepath = os.path.join(directory, filename)
-                if os.path.isfile(filepath):
-                    modified_time = datetime.fromtimestamp(os.path.getmtime(filepath))
-                    if modified_time > cutoff_time:
+        # scandir entries carry the directory's file type, so only one stat per log file
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if pattern_re.match(entry.name) and entry.is_file():
+                    stat = entry.stat()
+                    if stat.st_mtime > cutoff_timestamp:
                         recent_files.append({
-                            "filename": filename,
-                            "path": filepath,
-                            "modified": modified_time.isoformat(),
-                            "size": format_bytes(os.path.getsize(filepath))
+                            "filename": entry.name,
+                            "path": entry.path,
+                            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                            "size": format_bytes(stat.st_size)
                         })
         
-        return sorted(recent_files, key=lambda x: x['modified'], reverse=True)
+        return sorted(recent_files, key=itemgetter('modified'), reverse=True)
     except Exception as e:
         return [{"error": f"Error getting recent logs: {str(e)}"}]
 
 
 @mcp.tool
-def extract_errors(log_file: str) -> List[Dict[str, str]]:
+@_in_thread
+def extract_errors(log_file: str, max_results: int = DEFAULT_MAX_RESULTS) -> List[Dict[str, str]]:
     """
     Extract error messages from a log file
     """
-    error_patterns = [
-        r'error', r'exception', r'fail', r'critical', r'fatal', r'warn'
-    ]
-    
     if not os.path.exists(log_file):
         return [{"error": f"Log file does not exist: {log_file}"}]
     
     try:
-        errors = []
-        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, 1):
-                for pattern in error_patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        errors.append({
-                            "line_number": line_num,
-                            "content": line.rstrip('\n'),
-                            "level": "error" if 'error' in line.lower() else 
-                                   "warning" if 'warn' in line.lower() else "other",
-                            "timestamp": extract_timestamp(line) or "N/A"
-                        })
-                        break  # Only add line once even if it matches multiple patterns
-        
-        return errors
+        with open(log_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _first_results(_error_entries(mm), max_results)
     except Exception as e:
         return [{"error": f"Error extracting errors: {str(e)}"}]
 
 
 @mcp.tool
-def tail_log_file(file_path: str, num_lines: int = 10) -> List[str]:
+async def tail_log_file(file_path: str, num_lines: int = 10) -> List[str]:
     """
     Tail a log file (show last N lines) - similar to Unix tail command
     """
-    return read_log_file(file_path, num_lines, reverse=True)
+    return await read_log_file(file_path, num_lines, reverse=True)
 
 
 @mcp.tool
-def follow_log_file(file_path: str) -> str:
+async def follow_log_file(file_path: str, timeout: float = FOLLOW_TIMEOUT_SECONDS) -> str:
     """
-    Simulate following a log file (like tail -f) - returns last few lines
+    Follow a log file (like tail -f) - returns the last few lines plus anything appended within the timeout
     """
-    # In a real implementation, this would implement actual following
-    # For now, just return the last 10 lines
-    lines = read_log_file(file_path, 10, reverse=True)
+    try:
+        offset = os.path.getsize(file_path)
+    except OSError:
+        offset = None
+    lines = await read_log_file(file_path, 10, reverse=True)
+    if offset is not None:
+        try:
+            lines += await _wait_for_appended_lines(file_path, offset, timeout)
+        except OSError as e:
+            lines.append(f"Error following log file: {str(e)}")
     return f"Following {file_path}:\n" + "\n".join(lines)
 
 
 @mcp.tool
+@_in_thread
 def analyze_log_frequency(log_file: str, hours: int = 1) -> Dict[str, int]:
     """
     Analyze the frequency of log entries over the last N hours
@@ -201,20 +289,18 @@ def analyze_log_frequency(log_file: str, hours: int = 1) -> Dict[str, int]:
     
     try:
         time_threshold = datetime.now() - timedelta(hours=hours)
-        entries_count = 0
+        # Count lines without a timestamp in bulk, then parse each distinct timestamp once
+        timestamps = Counter()
+        with open(log_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    timestamps.update(_LINE_TIMESTAMP_BYTES_RE.findall(mm))
+        entries_count = _count_lines(log_file) - timestamps.total()
         
-        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                timestamp = extract_timestamp(line)
-                if timestamp:
-                    try:
-                        dt = parse_timestamp(timestamp)
-                        if dt and dt > time_threshold:
-                            entries_count += 1
-                    except:
-                        continue  # Skip lines with unparseable timestamps
-                else:
-                    entries_count += 1  # Count the line even without timestamp
+        for timestamp, count in timestamps.items():
+            dt = parse_timestamp(timestamp.decode('ascii'))
+            if dt and dt > time_threshold:
+                entries_count += count
         
         return {
             "time_period_hours": hours,
@@ -226,76 +312,235 @@ def analyze_log_frequency(log_file: str, hours: int = 1) -> Dict[str, int]:
 
 
 @mcp.tool
-def filter_logs_by_level(log_file: str, level: str) -> List[Dict[str, str]]:
+@_in_thread
+def filter_logs_by_level(
+    log_file: str,
+    level: str,
+    max_results: int = DEFAULT_MAX_RESULTS
+) -> List[Dict[str, str]]:
     """
     Filter log entries by level (ERROR, WARN, INFO, DEBUG)
     """
-    level_patterns = {
-        'ERROR': r'error|exception|critical|fatal',
-        'WARN': r'warn|warning',
-        'INFO': r'info|information',
-        'DEBUG': r'debug'
-    }
-    
-    if level.upper() not in level_patterns:
+    if level.upper() not in _LEVEL_KEYWORDS:
         return [{"error": f"Invalid log level: {level}"}]
     
     if not os.path.exists(log_file):
         return [{"error": f"Log file does not exist: {log_file}"}]
     
     try:
-        pattern = level_patterns[level.upper()]
-        filtered_logs = []
+        keywords = _LEVEL_KEYWORDS[level.upper()]
         
         with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, 1):
-                if re.search(pattern, line, re.IGNORECASE):
-                    filtered_logs.append({
-                        "line_number": line_num,
-                        "content": line.rstrip('\n'),
-                        "timestamp": extract_timestamp(line) or "N/A"
-                    })
-        
-        return filtered_logs
+            return _first_results(_level_entries(f, keywords), max_results)
     except Exception as e:
         return [{"error": f"Error filtering logs: {str(e)}"}]
 
 
+def _first_results(entries: Iterator[Dict[str, Any]], max_results: int) -> List[Dict[str, Any]]:
+    """
+    Materialize at most max_results entries, stopping the scan early (no cap when max_results <= 0)
+    """
+    return list(itertools.islice(entries, max_results if max_results > 0 else None))
+
+
+def _search_entries(f, search_re: re.Pattern) -> Iterator[Dict[str, Any]]:
+    """
+    Yield search_logs entries for lines matching the compiled search term
+    """
+    for line_num, line in enumerate(f, 1):
+        if search_re.search(line):
+            yield {
+                "line_number": line_num,
+                "content": line.rstrip('\n'),
+                "timestamp": extract_timestamp(line) or "N/A"
+            }
+
+
+def _error_entries(mm: mmap.mmap) -> Iterator[Dict[str, Any]]:
+    """
+    Yield extract_errors entries for lines of a mapped file containing an error keyword
+    """
+    for line_num, line in _matching_lines(mm, _ERROR_BYTES_RE):
+        lowered = line.lower()
+        yield {
+            "line_number": line_num,
+            "content": line,
+            "level": "error" if 'error' in lowered else 
+                   "warning" if 'warn' in lowered else "other",
+            "timestamp": extract_timestamp(line) or "N/A"
+        }
+
+
+def _level_entries(f, keywords: Tuple[str, ...]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield filter_logs_by_level entries for lines containing one of the level keywords
+    """
+    for line_num, line in enumerate(f, 1):
+        lowered = line.lower()
+        if any(keyword in lowered for keyword in keywords):
+            yield {
+                "line_number": line_num,
+                "content": line.rstrip('\n'),
+                "timestamp": extract_timestamp(line) or "N/A"
+            }
+
+
+async def _wait_for_appended_lines(file_path: str, offset: int, timeout: float) -> List[str]:
+    """
+    Wait until data is appended past offset (or the timeout passes) and return the new lines
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max(timeout, 0)
+    
+    watcher = None
+    changed = asyncio.Event()
+    if INotify is not None:
+        watcher = INotify()
+        watcher.add_watch(file_path, inotify_flags.MODIFY)
+        loop.add_reader(watcher.fileno(), changed.set)
+    
+    try:
+        while True:
+            size = os.path.getsize(file_path)
+            if size < offset:
+                # Truncated or rotated in place; follow from the start like tail -F
+                offset = 0
+            remaining = deadline - loop.time()
+            if size > offset or remaining <= 0:
+                break
+            if watcher is not None:
+                try:
+                    await asyncio.wait_for(changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+                watcher.read(timeout=0)
+                changed.clear()
+            else:
+                await asyncio.sleep(min(FOLLOW_POLL_INTERVAL_SECONDS, remaining))
+    finally:
+        if watcher is not None:
+            loop.remove_reader(watcher.fileno())
+            watcher.close()
+    
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        data = f.read()
+    return [line.decode('utf-8', errors='ignore') for line in data.splitlines()]
+
+
+def _tail_lines(f, lines: int) -> List[str]:
+    """
+    Read the last N lines by scanning backwards from the end of a binary file
+    """
+    if lines <= 0:
+        return []
+    
+    position = f.seek(0, os.SEEK_END)
+    blocks = []
+    newlines = 0
+    # N complete lines need N + 1 newlines in view (the first bounds the oldest line)
+    while position > 0 and newlines <= lines:
+        step = min(TAIL_BLOCK_SIZE, position)
+        position -= step
+        f.seek(position)
+        block = f.read(step)
+        blocks.append(block)
+        newlines += block.count(b'\n')
+    blocks.reverse()
+    
+    tail = b''.join(blocks).split(b'\n')
+    if tail[-1] == b'':
+        tail.pop()
+    return [line.decode('utf-8', errors='ignore').rstrip('\r') for line in tail[-lines:]]
+
+
+def _matching_lines(mm: mmap.mmap, pattern: re.Pattern) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (line number, decoded line) for each line of a mapped file that the pattern matches
+    """
+    line_num = 1
+    counted_to = 0
+    position = 0
+    while match := pattern.search(mm, position):
+        start = mm.rfind(b'\n', 0, match.start()) + 1
+        end = mm.find(b'\n', match.end())
+        if end == -1:
+            end = len(mm)
+        # Number lines only up to each hit rather than for every line in the file
+        line_num += mm[counted_to:start].count(b'\n')
+        counted_to = start
+        yield line_num, mm[start:end].decode('utf-8', errors='ignore').rstrip('\r')
+        position = end + 1
+
+
+def _count_lines(file_path: str) -> int:
+    """
+    Count lines by tallying newline bytes in large binary chunks
+    """
+    line_count = 0
+    last_chunk = b''
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(LINE_COUNT_BLOCK_SIZE):
+            line_count += chunk.count(b'\n')
+            last_chunk = chunk
+    # A final line without a trailing newline still counts
+    if last_chunk and not last_chunk.endswith(b'\n'):
+        line_count += 1
+    return line_count
+
+
+def _sample_log_file(filepath: str) -> Optional[Tuple[int, int]]:
+    """
+    Get a log file's size and the error count in its first lines, or None if it cannot be read
+    """
+    try:
+        size = os.stat(filepath).st_size
+    except OSError:
+        return None
+    
+    error_count = 0
+    try:
+        # Raw fixed-size reads of the head, skipping the buffered text layer and decoding
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            blocks = []
+            newlines = 0
+            budget = LOG_SAMPLE_MAX_BYTES
+            while newlines < LOG_SAMPLE_LINES and budget > 0:
+                block = os.read(fd, min(LOG_SAMPLE_BLOCK_SIZE, budget))
+                if not block:
+                    break
+                blocks.append(block)
+                newlines += block.count(b'\n')
+                budget -= len(block)
+        finally:
+            os.close(fd)
+        head = b''.join(blocks)
+        for line in head.lower().split(b'\n', LOG_SAMPLE_LINES)[:LOG_SAMPLE_LINES]:
+            if b'error' in line or b'exception' in line:
+                error_count += 1
+    except OSError:
+        pass
+    return size, error_count
+
+
 def extract_timestamp(log_line: str) -> str:
     """
     Extract timestamp from a log line using common patterns
     """
-    # Common timestamp patterns
-    patterns = [
-        r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}',  # YYYY-MM-DD HH:MM:SS
-        r'\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}',  # YYYY/MM/DD HH:MM:SS
-        r'\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}',  # MM/DD/YYYY HH:MM:SS
-        r'\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2}',  # MM-DD-YYYY HH:MM:SS
-        r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',  # ISO format
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, log_line)
-        if match:
-            return match.group()
+    match = _TIMESTAMP_RE.search(log_line)
+    if match:
+        return match.group()
     
     return None
 
 
+@functools.lru_cache(maxsize=16384)
 def parse_timestamp(timestamp_str: str) -> datetime:
     """
     Parse timestamp string to datetime object
     """
-    # Common formats
-    formats = [
-        '%Y-%m-%d %H:%M:%S',
-        '%Y/%m/%d %H:%M:%S',
-        '%m/%d/%Y %H:%M:%S',
-        '%m-%d-%Y %H:%M:%S',
-        '%Y-%m-%dT%H:%M:%S',
-    ]
-    
-    for fmt in formats:
+    for fmt in _TIMESTAMP_FORMATS:
         try:
             return datetime.strptime(timestamp_str, fmt)
         except ValueError:
@@ -308,15 +553,17 @@ def format_bytes(bytes_value: int) -> str:
     """
     Format bytes value to human readable format
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.2f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.2f} B"
+    # Each unit spans 10 bits, so the bit length picks the unit without a division loop
+    exponent = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (10 * exponent)):.2f} {_BYTE_UNITS[exponent]}"
 
 
 # Resources
 @mcp.resource("http://log-viewer-mcp-server.local/system-logs")
+@_in_thread
+@_ttl_cached
 def get_system_logs_info() -> List[Dict[str, str]]:
     """
     Get information about common system log files
@@ -344,6 +591,8 @@ def get_system_logs_info() -> List[Dict[str, str]]:
 
 
 @mcp.resource("http://log-viewer-mcp-server.local/application-logs")
+@_in_thread
+@_ttl_cached
 def get_application_logs_info() -> List[Dict[str, str]]:
     """
     Get information about common application log directories
@@ -359,14 +608,13 @@ def get_application_logs_info() -> List[Dict[str, str]]:
     logs_info = []
     for log_dir in app_log_dirs:
         if os.path.exists(log_dir):
-            for filename in os.listdir(log_dir):
-                if filename.endswith('.log'):
-                    filepath = os.path.join(log_dir, filename)
-                    if os.path.isfile(filepath):
-                        stat = os.stat(filepath)
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.log') and entry.is_file():
+                        stat = entry.stat()
                         logs_info.append({
-                            "name": filename,
-                            "path": filepath,
+                            "name": entry.name,
+                            "path": entry.path,
                             "size": format_bytes(stat.st_size),
                             "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
                             "directory": log_dir
@@ -376,6 +624,8 @@ def get_application_logs_info() -> List[Dict[str, str]]:
 
 
 @mcp.resource("http://log-viewer-mcp-server.local/log-statistics")
+@_in_thread
+@_ttl_cached
 def get_log_statistics() -> Dict[str, Any]:
     """
     Get overall log statistics for the system
@@ -385,26 +635,21 @@ def get_log_statistics() -> Dict[str, Any]:
     total_size = 0
     error_count = 0
     
+    log_files = []
     for log_dir in log_dirs:
         if os.path.exists(log_dir):
             for root, dirs, files in os.walk(log_dir):
                 for file in files:
                     if file.endswith('.log'):
-                        filepath = os.path.join(root, file)
-                        try:
-                            stat = os.stat(filepath)
-                            total_size += stat.st_size
-                            total_files += 1
-                            
-                            # Sample the file to count errors (first 100 lines)
-                            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                                for i, line in enumerate(f):
-                                    if i > 100:  # Only check first 100 lines for performance
-                                        break
-                                    if 'error' in line.lower() or 'exception' in line.lower():
-                                        error_count += 1
-                        except:
-                            continue
+                        log_files.append(os.path.join(root, file))
+    
+    # Sampling is dominated by open/read waits, so overlap it across threads
+    with ThreadPoolExecutor(max_workers=LOG_SCAN_WORKERS) as executor:
+        for sample in executor.map(_sample_log_file, log_files):
+            if sample is not None:
+                total_files += 1
+                total_size += sample[0]
+                error_count += sample[1]
     
     return {
         "total_log_files": total_files,
@@ -29,19 +29,24 @@ def list_campaigns(
     List campaigns in the Mailchimp account
     """
     # This would connect to Mailchimp API in a real implementation
+    indexes = range(limit)
+    ids = [f"camp_{i:04d}" for i in indexes]
+    titles = [f"Campaign {i}: Newsletter" for i in indexes]
+    subject_lines = [f"Subject for Campaign {i}" for i in indexes]
+    preview_texts = [f"Preview text for Campaign {i}" for i in indexes]
     return [
         {
-            "id": f"camp_{i:04d}",
+            "id": campaign_id,
             "type": type,
             "status": status,
-            "title": f"Campaign {i}: Newsletter",
-            "subject_line": f"Subject for Campaign {i}",
-            "preview_text": f"Preview text for Campaign {i}",
+            "title": title,
+            "subject_line": subject_line,
+            "preview_text": preview_text,
             "recipients": {"list_id": "list_1", "list_name": "Subscribers"},
             "send_time": "2023-01-01T10:00:00Z",
             "emails_sent": 1250 + i * 100
         }
-        for i in range(limit)
+        for i, campaign_id, title, subject_line, preview_text in zip(indexes, ids, titles, subject_lines, preview_texts)
     ]
 
 
@@ -95,14 +100,18 @@ def list_audiences(limit: int = 20) -> List[Dict[str, Any]]:
     """
     List audiences (email lists) in the Mailchimp account
     """
+    indexes = range(limit)
+    ids = [f"list_{i:03d}" for i in indexes]
+    names = [f"Audience {i}" for i in indexes]
+    subscribe_urls = [f"https://example.com/subscribe/{i}" for i in indexes]
     return [
         {
-            "id": f"list_{i:03d}",
-            "name": f"Audience {i}",
+            "id": list_id,
+            "name": name,
             "member_count": 1200 + i * 100,
             "type": "html",
             "email_type_option": True,
-            "subscribe_url_short": f"https://example.com/subscribe/{i}",
+            "subscribe_url_short": subscribe_url,
             "stats": {
                 "member_count": 1200 + i * 100,
                 "unsubscribe_count": 10 + i,
@@ -111,7 +120,7 @@ def list_audiences(limit: int = 20) -> List[Dict[str, Any]]:
                 "unsubscribe_count_since_send": 1 + i
             }
         }
-        for i in range(limit)
+        for i, list_id, name, subscribe_url in zip(indexes, ids, names, subscribe_urls)
     ]
 
 
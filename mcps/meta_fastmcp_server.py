@@ -7,87 +7,109 @@ MCP server creation and management tasks.
 """
 
 from fastmcp import FastMCP
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import asyncio
+import base64
+import functools
+import io
 import os
+import psutil
+import shlex
+import string
 import subprocess
 import json
+import tarfile
+import time
+import zipfile
 from datetime import datetime
 
 
-# Initialize the MCP server
-mcp = FastMCP(
-    name="Simple Meta MCP Server",
-    instructions="Provides utilities for managing and creating MCP servers",
-    version="1.0.0"
-)
+# Commands run_system_command may execute; matched against argv[0]
+ALLOWED_COMMANDS = frozenset(("ls", "pwd", "whoami", "date", "echo", "ps", "top"))
 
+# How long a system-metrics sample is reused before psutil is queried again
+SYSTEM_METRICS_TTL_SECONDS = 1.0
 
-# Tools
-@mcp.tool
-def create_mcp_skeleton(
-    name: str, 
-    description: str, 
-    tools: List[str] = None, 
-    resources: List[str] = None, 
-    prompts: List[str] = None
-) -> Dict[str, Any]:
+_system_metrics_cache: Dict[str, Any] = {"expires": 0.0, "value": None}
+
+# cpu_percent(interval=None) measures since its previous call and returns 0.0
+# the first time, so take the baseline reading at import
+psutil.cpu_percent(interval=None)
+
+# Last formatted timestamp, reused until the wall-clock second changes
+_now_iso_cache: Dict[str, Any] = {"second": -1, "value": ""}
+
+
+def _now_iso() -> str:
     """
-    Create a skeleton for a new MCP server
+    Current local time as an ISO string at one-second resolution
     """
-    if tools is None:
-        tools = ["list_items", "get_item"]
-    if resources is None:
-        resources = ["get_status"]
-    if prompts is None:
-        prompts = ["explain_concept"]
-    
-    # Create project files
-    skeleton = {
-        "project_name": name,
-        "description": description,
-        "files": {
-            "server.py": f'''#!/usr/bin/env python3
+    second = int(time.time())
+    if second != _now_iso_cache["second"]:
+        _now_iso_cache["value"] = datetime.fromtimestamp(second).isoformat()
+        _now_iso_cache["second"] = second
+    return _now_iso_cache["value"]
+
+
+# Output formats accepted by generate_mcp_project; tar and zip bundle all files in one archive
+PROJECT_OUTPUT_FORMATS = ("dict", "tar", "zip")
+
+# Static payload served by the config-templates resource
+CONFIG_TEMPLATES = {
+    "basic": {
+        "description": "Basic configuration with essential settings",
+        "file": "config.json"
+    },
+    "env": {
+        "description": "Environment variable configuration",
+        "file": ".env"
+    }
+}
+
+
+# Project file templates rendered by the skeleton and project generators
+SKELETON_SERVER_TEMPLATE = string.Template('''#!/usr/bin/env python3
 """
-{name} MCP Server
-{description}
+$name MCP Server
+$description
 """
 from fastmcp import FastMCP
 from typing import List, Dict, Any
 
 # Initialize the MCP server
 mcp = FastMCP(
-    name="{name}",
-    instructions="{description}",
+    name="$name",
+    instructions="$description",
     version="1.0.0"
 )
 
 # Example tools
 @mcp.tool
 def list_items():
-    return {{"message": "List of items"}}
+    return {"message": "List of items"}
 
 @mcp.tool
 def get_item(item_id: str):
-    return {{"item_id": item_id, "data": "item data"}}
+    return {"item_id": item_id, "data": "item data"}
 
 # Example resources
-@mcp.resource("http://{name.lower().replace(' ', '-')}.local/status")
+@mcp.resource("http://$slug.local/status")
 def get_status():
-    return {{"status": "running", "server": "{name}"}}
+    return {"status": "running", "server": "$name"}
 
 # Example prompts
-@mcp.prompt("/{name.replace(' ', '').lower()}-explain")
+@mcp.prompt("/$compact-explain")
 def explain_concept():
     return "Explain the concept..."
 
 if __name__ == "__main__":
     import asyncio
     asyncio.run(mcp.run_stdio_async())
-''',
-            "README.md": f'''# {name} MCP Server
+''')
+
+SKELETON_README_TEMPLATE = string.Template('''# $name MCP Server
 
-{description}
+$description
 
 ## Setup
 ```bash
@@ -98,14 +120,125 @@ pip install -r requirements.txt
 ```bash
 python server.py
 ```
-''',
-            "requirements.txt": "fastmcp>=2.0.0"
-        }
+''')
+
+PROJECT_SERVER_TEMPLATE = string.Template('''#!/usr/bin/env python3
+"""
+$project_name MCP Server
+Generated by Simple Meta MCP Server
+"""
+import asyncio
+from fastmcp import FastMCP
+from typing import List, Dict, Any
+
+# Initialize the MCP server
+mcp = FastMCP(
+    name="$project_name",
+    instructions="Provides $lower_name functionality",
+    version="1.0.0"
+)
+
+# Generated tools
+@mcp.tool
+def list_items():
+    return {"message": "List of items for $project_name"}
+
+# Generated resources
+@mcp.resource("http://$slug.local/status")
+def get_status():
+    return {"status": "running", "server": "$project_name"}
+
+# Generated prompts
+@mcp.prompt("/$compact-query")
+def query_prompt():
+    return "Query for $project_name..."
+
+if __name__ == "__main__":
+    # Use stdio transport for MCP server
+    asyncio.run(mcp.run_stdio_async())
+''')
+
+PROJECT_README_TEMPLATE = string.Template('''# $project_name MCP Server
+
+This is a generated MCP server that provides $lower_name functionality.
+
+## Setup
+
+```bash
+pip install -r requirements.txt
+```
+
+## Run
+
+```bash
+python server.py
+```
+
+## Features
+
+- Tools: list_items
+- Resources: get_status
+- Prompts: query_prompt
+''')
+
+REQUIREMENTS_TXT = "fastmcp>=2.0.0"
+
+
+# Initialize the MCP server
+mcp = FastMCP(
+    name="Simple Meta MCP Server",
+    instructions="Provides utilities for managing and creating MCP servers",
+    version="1.0.0"
+)
+
+
+# Tools
+@mcp.tool
+def create_mcp_skeleton(
+    name: str, 
+    description: str, 
+    tools: List[str] = None, 
+    resources: List[str] = None, 
+    prompts: List[str] = None
+) -> Dict[str, Any]:
+    """
+    Create a skeleton for a new MCP server
+    """
+    if tools is None:
+        tools = ["list_items", "get_item"]
+    if resources is None:
+        resources = ["get_status"]
+    if prompts is None:
+        prompts = ["explain_concept"]
+    
+    # Create project files
+    skeleton = {
+        "project_name": name,
+        "description": description,
+        "files": dict(_skeleton_files(name, description))
     }
     
     return skeleton
 
 
+@functools.lru_cache(maxsize=64)
+def _skeleton_files(name: str, description: str) -> Dict[str, str]:
+    """
+    Render the skeleton project files, reused for repeated names
+    """
+    fields = {
+        "name": name,
+        "description": description,
+        "slug": name.lower().replace(' ', '-'),
+        "compact": name.replace(' ', '').lower(),
+    }
+    return {
+        "server.py": SKELETON_SERVER_TEMPLATE.substitute(fields),
+        "README.md": SKELETON_README_TEMPLATE.substitute(fields),
+        "requirements.txt": REQUIREMENTS_TXT
+    }
+
+
 @mcp.tool
 def validate_mcp_config(config_content: str) -> Dict[str, Any]:
     """
@@ -124,9 +257,7 @@ def validate_mcp_config(config_content: str) -> Dict[str, Any]:
         issues.append("Missing proper MCP server execution")
     
     # Check for decorators
-    tool_count = config_content.count("@mcp.tool")
-    resource_count = config_content.count("@mcp.resource") 
-    prompt_count = config_content.count("@mcp.prompt")
+    tool_count, resource_count, prompt_count = _component_counts(config_content)
     
     if tool_count == 0 and resource_count == 0 and prompt_count == 0:
         issues.append("No MCP components (tools, resources, or prompts) defined")
@@ -160,9 +291,11 @@ def analyze_existing_mcp(server_content: str) -> Dict[str, Any]:
         analysis["imports"].append("fastmcp")
     
     # Count decorators
-    analysis["tools_count"] = server_content.count("@mcp.tool")
-    analysis["resources_count"] = server_content.count("@mcp.resource")
-    analysis["prompts_count"] = server_content.count("@mcp.prompt")
+    (
+        analysis["tools_count"],
+        analysis["resources_count"],
+        analysis["prompts_count"],
+    ) = _component_counts(server_content)
     
     # Track all decorators found
     if analysis["tools_count"] > 0:
@@ -177,7 +310,7 @@ def analyze_existing_mcp(server_content: str) -> Dict[str, Any]:
         analysis["potential_issues"].append("Missing proper server execution")
         analysis["suggestions"].append("Add asyncio.run(mcp.run_stdio_async()) in main block")
     
-    if "import asyncio" not in server_content and ("@mcp.tool" in server_content or "@mcp.resource" in server_content):
+    if (analysis["tools_count"] or analysis["resources_count"]) and "import asyncio" not in server_content:
         analysis["potential_issues"].append("Missing asyncio import")
         analysis["suggestions"].append("Add 'import asyncio' at the top of the file")
     
@@ -188,6 +321,21 @@ def analyze_existing_mcp(server_content: str) -> Dict[str, Any]:
     return analysis
 
 
+def _component_counts(content: str) -> Tuple[int, int, int]:
+    """
+    Count tool, resource and prompt decorators in server source
+    """
+    # str.count runs in C, so separate counts beat a Python-level single
+    # pass; skip them entirely when no decorator is present at all.
+    if "@mcp." not in content:
+        return 0, 0, 0
+    return (
+        content.count("@mcp.tool"),
+        content.count("@mcp.resource"),
+        content.count("@mcp.prompt"),
+    )
+
+
 @mcp.tool
 def run_system_command(command: str) -> Dict[str, Any]:
     """
@@ -195,18 +343,17 @@ def run_system_command(command: str) -> Dict[str, Any]:
     """
     try:
         # For security, we'll restrict to only safe commands
-        allowed_commands = ["ls", "pwd", "whoami", "date", "echo", "ps", "top"]
+        argv = shlex.split(command)
         
-        if not any(command.startswith(cmd) for cmd in allowed_commands):
+        if not argv or argv[0] not in ALLOWED_COMMANDS:
             return {
                 "error": "Command not allowed",
-                "allowed_commands": allowed_commands
+                "allowed_commands": sorted(ALLOWED_COMMANDS)
             }
         
-        # Execute the command
+        # Execute the command directly, without an intermediate shell
         result = subprocess.run(
-            command, 
-            shell=True, 
+            argv, 
             capture_output=True, 
             text=True, 
             timeout=30
@@ -234,6 +381,7 @@ def run_system_command(command: str) -> Dict[str, Any]:
 def generate_mcp_project(
     project_name: str,
     features: List[str] = None,
+    output_format: str = "dict",
 ) -> Dict[str, Any]:
     """
     Generate a complete MCP project with specified features
@@ -241,67 +389,20 @@ def generate_mcp_project(
     if features is None:
         features = ["tools", "resources", "prompts"]
     
+    if output_format not in PROJECT_OUTPUT_FORMATS:
+        return {"error": f"Invalid output format. Use one of: {', '.join(PROJECT_OUTPUT_FORMATS)}"}
+    
+    if output_format != "dict":
+        # One base64 archive lets callers persist the project with a single write
+        return {
+            "project_name": project_name,
+            "features": features,
+            "archive_format": output_format,
+            "archive": _project_archive(_project_files(project_name), output_format)
+        }
+    
     # Create project files
-    project_files = {
-        "server.py": f'''#!/usr/bin/env python3
-"""
-{project_name} MCP Server
-Generated by Simple Meta MCP Server
-"""
-import asyncio
-from fastmcp import FastMCP
-from typing import List, Dict, Any
-
-# Initialize the MCP server
-mcp = FastMCP(
-    name="{project_name}",
-    instructions="Provides {project_name.lower()} functionality",
-    version="1.0.0"
-)
-
-# Generated tools
-@mcp.tool
-def list_items():
-    return {{"message": "List of items for {project_name}"}}
-
-# Generated resources
-@mcp.resource("http://{project_name.lower().replace(' ', '-')}.local/status")
-def get_status():
-    return {{"status": "running", "server": "{project_name}"}}
-
-# Generated prompts
-@mcp.prompt("/{project_name.lower().replace(' ', '')}-query")
-def query_prompt():
-    return "Query for {project_name}..."
-
-if __name__ == "__main__":
-    # Use stdio transport for MCP server
-    asyncio.run(mcp.run_stdio_async())
-''',
-        "README.md": f'''# {project_name} MCP Server
-
-This is a generated MCP server that provides {project_name.lower()} functionality.
-
-## Setup
-
-```bash
-pip install -r requirements.txt
-```
-
-## Run
-
-```bash
-python server.py
-```
-
-## Features
-
-- Tools: list_items
-- Resources: get_status
-- Prompts: query_prompt
-''',
-        "requirements.txt": "fastmcp>=2.0.0"
-    }
+    project_files = dict(_project_files(project_name))
     
     return {
         "project_name": project_name,
@@ -310,6 +411,46 @@ python server.py
     }
 
 
+def _project_archive(files: Dict[str, str], archive_format: str) -> str:
+    """
+    Pack project files into a tar or zip archive, base64-encoded for transport
+    """
+    buffer = io.BytesIO()
+    if archive_format == "zip":
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for filename, content in files.items():
+                archive.writestr(filename, content)
+    else:
+        mtime = int(time.time())
+        with tarfile.open(fileobj=buffer, mode="w") as archive:
+            for filename, content in files.items():
+                data = content.encode()
+                info = tarfile.TarInfo(filename)
+                info.size = len(data)
+                info.mtime = mtime
+                archive.addfile(info, io.BytesIO(data))
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+@functools.lru_cache(maxsize=64)
+def _project_files(project_name: str) -> Dict[str, str]:
+    """
+    Render the generated project files, reused for repeated project names
+    """
+    lower_name = project_name.lower()
+    fields = {
+        "project_name": project_name,
+        "lower_name": lower_name,
+        "slug": lower_name.replace(' ', '-'),
+        "compact": lower_name.replace(' ', ''),
+    }
+    return {
+        "server.py": PROJECT_SERVER_TEMPLATE.substitute(fields),
+        "README.md": PROJECT_README_TEMPLATE.substitute(fields),
+        "requirements.txt": REQUIREMENTS_TXT
+    }
+
+
 # Resources
 @mcp.resource("http://simple-meta-mcp-server.local/server-info")
 def get_server_info() -> Dict[str, Any]:
@@ -320,7 +461,7 @@ def get_server_info() -> Dict[str, Any]:
         "name": mcp.name,
         "description": "A simple MCP server for managing MCP systems",
         "version": mcp.version,
-        "server_time": datetime.now().isoformat(),
+        "server_time": _now_iso(),
         "uptime_seconds": 0  # Simplified for demo
     }
 
@@ -330,10 +471,26 @@ def get_system_metrics() -> Dict[str, float]:
     """
     Get basic system metrics
     """
+    now = time.monotonic()
+    if now >= _system_metrics_cache["expires"]:
+        _system_metrics_cache["value"] = _sample_system_metrics()
+        _system_metrics_cache["expires"] = now + SYSTEM_METRICS_TTL_SECONDS
+    return _system_metrics_cache["value"]
+
+
+def _sample_system_metrics() -> Dict[str, float]:
+    """
+    Read current CPU, memory and connection figures from psutil
+    """
+    try:
+        connections = psutil.net_connections(kind="tcp")
+        active_connections = sum(1 for conn in connections if conn.status == psutil.CONN_ESTABLISHED)
+    except psutil.AccessDenied:
+        active_connections = 0
     return {
-        "cpu_usage": 15.2,
-        "memory_usage": 42.8,
-        "active_connections": 3
+        "cpu_usage": psutil.cpu_percent(interval=None),
+        "memory_usage": psutil.virtual_memory().percent,
+        "active_connections": active_connections
     }
 
 
@@ -342,16 +499,7 @@ def get_config_templates() -> Dict[str, Any]:
     """
     Get available configuration templates
     """
-    return {
-        "basic": {
-            "description": "Basic configuration with essential settings",
-            "file": "config.json"
-        },
-        "env": {
-            "description": "Environment variable configuration",
-            "file": ".env"
-        }
-    }
+    return CONFIG_TEMPLATES
 
 
 # Prompts
@@ -435,7 +583,7 @@ def health_check() -> Dict[str, str]:
     """
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "service": "simple-meta-mcp-server"
     }
 